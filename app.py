@@ -10,29 +10,183 @@ import sys
 
 # Fix Windows console encoding for emoji/unicode support
 if sys.platform == 'win32':
-    import codecs
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
+    sys.stdout.reconfigure(encoding='utf-8', errors='strict')
+    sys.stderr.reconfigure(encoding='utf-8', errors='strict')
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request
+from fuzzywuzzy import fuzz
 from src.data.multimodal_parser import MultiModalGTFSParser
 from src.data.stop_index import StopIndex
 from src.routing.transfer_journey_planner import TransferJourneyPlanner
+from src.utils.cache import TTLCache
+from src.utils.logging_config import get_logger
 from src.data.service_manager import get_service_manager
 from datetime import datetime
 import json
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 import os
 import subprocess
 import time
 import atexit
 import signal
+import threading
+import bisect
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from operator import itemgetter
 
 app = Flask(__name__)
+logger = get_logger(__name__)
+
+
+def ojsonify(obj, status=200):
+    """Serialize obj with orjson into a JSON response (faster than jsonify)."""
+    return Response(
+        orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+        status=status,
+        mimetype='application/json'
+    )
+
 
 # FastAPI backend URL for vehicle/alerts data
 FASTAPI_URL = os.environ.get('FASTAPI_URL', 'http://localhost:8000')
 
+# Run the FastAPI backend inside this process instead of as a uvicorn
+# subprocess: /api/v1/* is served by the mounted app and the proxy endpoints
+# call its route handlers directly, with no loopback HTTP hop.
+EMBED_FASTAPI = os.environ.get('EMBED_FASTAPI', '').lower() in ('1', 'true', 'yes')
+
+
+def _build_embedded_handlers():
+    """Map backend paths to the FastAPI route handlers called in-process."""
+    from src.api.routes import alerts as alerts_routes, vehicles as vehicles_routes
+
+    # Called as plain functions, so every parameter FastAPI would normally
+    # resolve (Query/Header defaults) has to be bound explicitly
+    return {
+        '/api/v1/vehicles': vehicles_routes.get_all_vehicles,
+        '/api/v1/vehicles/summary': vehicles_routes.get_vehicle_summary,
+        '/api/v1/alerts': partial(alerts_routes.get_all_alerts, active_only=True, if_none_match=None),
+    }
+
+
+if EMBED_FASTAPI:
+    from a2wsgi import ASGIMiddleware
+    from fastapi import HTTPException
+    from fastapi import Response as FastAPIResponse
+    from src.api.main import app as fastapi_app
+    from src.api.dependencies import get_transit_service
+
+    _EMBEDDED_HANDLERS = _build_embedded_handlers()
+
+# Shared session so proxy calls to the backend reuse pooled connections
+_backend = requests.Session()
+_backend.mount('http://', HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0))
+_backend.headers.update({'Accept-Encoding': 'gzip'})
+
+# Modes the backend serves vehicles and alerts for. Proxy endpoints reject
+# anything else up front, so caches and fetch locks only ever hold these keys.
+VEHICLE_MODES = ('metro', 'vline', 'tram', 'bus')
+
+# Short-lived caches of successful proxy bodies, keyed by mode. Realtime feeds
+# only refresh every 20-30s, so concurrent map clients can share one fetch.
+_vehicle_cache = TTLCache(default_ttl=10, max_size=8)
+_alerts_cache = TTLCache(default_ttl=30, max_size=8)
+_fetch_locks = {}
+_fetch_locks_guard = threading.Lock()
+
+
+def _call_backend(path, mode):
+    """
+    Call a backend endpoint for a mode.
+
+    Uses the in-process route handler when EMBED_FASTAPI is set, otherwise
+    an HTTP request over the pooled session.
+
+    Returns:
+        Tuple of (status_code, body bytes)
+    """
+    if EMBED_FASTAPI:
+        try:
+            result = _EMBEDDED_HANDLERS[path](mode=mode, service=get_transit_service())
+        except HTTPException as e:
+            return e.status_code, orjson.dumps({'detail': e.detail})
+        if isinstance(result, FastAPIResponse):
+            # Handlers that pre-serialize (e.g. alerts) return the body directly
+            return result.status_code, result.body
+        return 200, result.model_dump_json().encode('utf-8')
+
+    response = _backend.get(f'{FASTAPI_URL}{path}', params={'mode': mode}, timeout=10)
+    return response.status_code, response.content
+
+
+def _fetch_backend_cached(cache, path, mode):
+    """
+    Fetch a backend endpoint for a mode, serving 200 bodies from cache.
+
+    A per-(path, mode) lock ensures only one upstream request is made on
+    a cache miss; other callers wait and then read the cached body.
+
+    Returns:
+        Tuple of (status_code, body bytes)
+    """
+    body = cache.get(mode)
+    if body is not None:
+        return 200, body
+
+    with _fetch_locks_guard:
+        lock = _fetch_locks.setdefault((path, mode), threading.Lock())
+
+    with lock:
+        body = cache.get(mode)
+        if body is not None:
+            return 200, body
+
+        status_code, body = _call_backend(path, mode)
+        if status_code == 200:
+            cache.set(mode, body)
+        return status_code, body
+
+
+def _stream_backend_cached(cache, path, mode):
+    """
+    Like _fetch_backend_cached, but stream a cache miss to the client.
+
+    On a miss the upstream body is relayed in 16 KB chunks as it arrives and
+    stored in the cache once fully read. Concurrent misses are not
+    coalesced, since the upstream response outlives the request handler.
+
+    Returns:
+        Tuple of (status_code, body) where body is bytes on a cache hit or
+        an iterator of chunks on a miss; body is None for non-200 responses.
+    """
+    if EMBED_FASTAPI:
+        # Nothing to stream from an in-process call
+        return _fetch_backend_cached(cache, path, mode)
+
+    body = cache.get(mode)
+    if body is not None:
+        return 200, body
+
+    upstream = _backend.get(f'{FASTAPI_URL}{path}', params={'mode': mode}, timeout=10, stream=True)
+    if upstream.status_code != 200:
+        upstream.close()
+        return upstream.status_code, None
+
+    def relay():
+        chunks = []
+        try:
+            for chunk in upstream.iter_content(chunk_size=16384):
+                chunks.append(chunk)
+                yield chunk
+            cache.set(mode, b''.join(chunks))
+        finally:
+            upstream.close()
+
+    return 200, relay()
+
 # Global variable to hold the FastAPI process
 fastapi_process = None
 
@@ -47,7 +201,7 @@ def start_fastapi_backend():
     try:
         # Check if FastAPI is already running
         try:
-            response = requests.get(f'{FASTAPI_URL}/api/v1/health', timeout=2)
+            response = _backend.get(f'{FASTAPI_URL}/api/v1/health', timeout=2)
             if response.status_code == 200:
                 print(f"✓ FastAPI backend already running at {FASTAPI_URL}")
                 return
@@ -62,19 +216,23 @@ def start_fastapi_backend():
             creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if sys.platform == 'win32' else 0
         )
 
-        # Wait for FastAPI to start (max 10 seconds)
+        # Wait for FastAPI to start (max ~10 seconds), polling with
+        # exponential backoff so we return as soon as it is ready
         print("Waiting for FastAPI backend to start...", end="", flush=True)
-        for i in range(20):
-            time.sleep(0.5)
+        deadline = time.monotonic() + 10
+        delay = 0.05
+        while time.monotonic() < deadline:
             try:
-                response = requests.get(f'{FASTAPI_URL}/api/v1/health', timeout=1)
+                response = _backend.get(f'{FASTAPI_URL}/api/v1/health', timeout=0.5)
                 if response.status_code == 200:
                     print(" ✓")
                     print(f"✓ FastAPI backend started at {FASTAPI_URL}")
                     print(f"✓ Swagger UI available at {FASTAPI_URL}/docs")
                     return
-            except:
+            except requests.exceptions.RequestException:
                 print(".", end="", flush=True)
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.5)
 
         print("\n⚠ FastAPI backend may take longer to start")
         print(f"  Check manually at {FASTAPI_URL}/docs")
@@ -120,25 +278,116 @@ print("="*60)
 print("Initializing PTV Journey Planner with Multi-Modal Support")
 print("="*60)
 
-parser = None
-planner = None
-stop_index = None
+# All GTFS-derived data lives in one dict that is replaced wholesale on reload.
+# Handlers read `state = _state` once, so each request sees a consistent
+# generation and keeps serving the old data while a reload is in progress.
+_state = {
+    'parser': None,
+    'planner': None,
+    'stop_index': None,
+    'stations_json': None,     # Pre-serialized /api/stations payload
+    'station_names': [],       # Sorted unique lowercase names for prefix lookups
+    'station_by_name': {},     # Lowercase name -> stop
+    'stop_coords': {},         # stop_id -> (lat, lon) as floats
+    'autocomplete': None,      # lru-cached _autocomplete bound to this generation
+    'fuzzy_stop_id': None,     # lru-cached _fuzzy_stop_id bound to this generation
+}
+_reload_lock = threading.Lock()
+
+
+def _build_stations_json(gtfs_parser):
+    """Serialize the name-sorted station list once per GTFS load."""
+    stations = sorted(
+        (
+            {
+                'id': stop.stop_id,
+                'name': stop.stop_name,
+                'platform': stop.platform_code,
+                'lat': stop.stop_lat,
+                'lon': stop.stop_lon
+            }
+            for stop in gtfs_parser.stops.values()
+        ),
+        key=itemgetter('name')
+    )
+    return orjson.dumps(stations)
 
-try:
+
+def _build_name_index(gtfs_parser):
+    """Build the sorted lowercase name list and name -> stop lookup."""
+    by_name = {}
+    for stop in gtfs_parser.stops.values():
+        by_name.setdefault(stop.stop_name.lower(), stop)
+    return sorted(by_name), by_name
+
+
+def _build_stop_coords(gtfs_parser):
+    """
+    Map each stop ID to its (lat, lon) parsed as floats.
+
+    Stops with blank or invalid coordinates are left out (and render
+    without a map position) rather than failing the whole data load.
+    """
+    coords = {}
+    skipped = 0
+    for stop_id, stop in gtfs_parser.stops.items():
+        try:
+            coords[stop_id] = (float(stop.stop_lat), float(stop.stop_lon))
+        except (TypeError, ValueError):
+            skipped += 1
+    if skipped:
+        logger.warning("Skipped %d stops with blank or invalid coordinates", skipped)
+    return coords
+
+
+def _make_state(gtfs_parser, journey_planner, index):
+    """Build a state dict, including cached payloads, for a loaded parser."""
+    station_names, station_by_name = _build_name_index(gtfs_parser)
+    state = {
+        'parser': gtfs_parser,
+        'planner': journey_planner,
+        'stop_index': index,
+        'stations_json': _build_stations_json(gtfs_parser),
+        'station_names': station_names,
+        'station_by_name': station_by_name,
+        'stop_coords': _build_stop_coords(gtfs_parser),
+    }
+    # Lookup caches belong to the generation they were computed from, so a
+    # lookup racing a reload can never leave old results in the new caches
+    state['autocomplete'] = lru_cache(maxsize=1024)(partial(_autocomplete, state))
+    state['fuzzy_stop_id'] = lru_cache(maxsize=4096)(partial(_fuzzy_stop_id, state))
+    return state
+
+
+def _load_state():
+    """Load GTFS data and build a fresh state dict."""
     # Load all core public transport modes (trains + trams)
     # You can add '4', '5', '6' for buses if needed (slower startup)
-    parser = MultiModalGTFSParser(base_gtfs_dir="data/gtfs", modes_to_load=['1', '2', '3'])
-    parser.load_all()
+    gtfs_parser = MultiModalGTFSParser(base_gtfs_dir="data/gtfs", modes_to_load=['1', '2', '3'])
+    gtfs_parser.load_all()
+
+    # Create transfer-aware multi-modal planner and stop index from merged stops
+    return _make_state(gtfs_parser, TransferJourneyPlanner(gtfs_parser), StopIndex(gtfs_parser))
+
+
+def _publish_state(new_state):
+    """Swap in a new state generation (its lookup caches start empty)."""
+    global _state
+    _state = new_state
 
-    # Create transfer-aware multi-modal planner
-    planner = TransferJourneyPlanner(parser)
 
-    # Create stop index from merged stops
-    stop_index = StopIndex(parser)
+def _print_load_summary(gtfs_parser):
+    """Print stop and mode counts for freshly loaded GTFS data."""
+    print(f"  Total stops indexed: {len(gtfs_parser.stops)}")
+    print(f"  Modes loaded: {', '.join([gtfs_parser.get_mode_info(m)['name'] for m in gtfs_parser.get_loaded_modes()])}")
+
+
+try:
+    # Nothing is cached yet, so the state can be assigned directly
+    _state = _load_state()
 
     print(f"\n✓ Multi-modal system ready!")
-    print(f"  Total stops indexed: {len(parser.stops)}")
-    print(f"  Modes loaded: {', '.join([parser.get_mode_info(m)['name'] for m in parser.get_loaded_modes()])}")
+    _print_load_summary(_state['parser'])
     print("="*60)
 
 except Exception as e:
@@ -148,37 +397,59 @@ except Exception as e:
     print("="*60)
 
 
+def _do_reload():
+    """Build the new state in the background, then publish it."""
+    try:
+        print("\n🔄 Reloading Flask transit data...")
+
+        new_state = _load_state()
+        _publish_state(new_state)
+
+        print(f"✓ Flask data reloaded successfully")
+        _print_load_summary(new_state['parser'])
+
+    except Exception as e:
+        print(f"✗ Flask reload failed: {e}")
+    finally:
+        _reload_lock.release()
+
+
 def reload_flask_data():
     """
     Reload Flask parsers and planners after GTFS data update.
 
     This function is called by the service manager after successful GTFS updates.
+    The reload runs on a background thread; requests keep using the current
+    data until the new data is fully built.
 
     Returns:
-        bool: True if reload successful, False otherwise
+        bool: True if a reload was started or is already running, False otherwise
     """
-    global parser, planner, stop_index
+    if not _reload_lock.acquire(blocking=False):
+        print("🔄 Flask reload already in progress")
+        return True
 
     try:
-        print("\n🔄 Reloading Flask transit data...")
-
-        # Reload multi-modal parser
-        parser = MultiModalGTFSParser(base_gtfs_dir="data/gtfs", modes_to_load=['1', '2', '3'])
-        parser.load_all()
+        threading.Thread(target=_do_reload, name='flask-gtfs-reload', daemon=True).start()
+        return True
+    except Exception as e:
+        _reload_lock.release()
+        print(f"✗ Flask reload failed to start: {e}")
+        return False
 
-        # Rebuild planner and index
-        planner = TransferJourneyPlanner(parser)
-        stop_index = StopIndex(parser)
 
-        print(f"✓ Flask data reloaded successfully")
-        print(f"  Total stops indexed: {len(parser.stops)}")
-        print(f"  Modes loaded: {', '.join([parser.get_mode_info(m)['name'] for m in parser.get_loaded_modes()])}")
+if EMBED_FASTAPI:
+    # Route FastAPI's own paths (API and docs) to the mounted ASGI app
+    _flask_wsgi_app = app.wsgi_app
+    _fastapi_wsgi_app = ASGIMiddleware(fastapi_app)
+    _FASTAPI_PATH_PREFIXES = ('/api/v1/', '/docs', '/redoc', '/openapi.json')
 
-        return True
+    def _dispatch_wsgi(environ, start_response):
+        if environ.get('PATH_INFO', '').startswith(_FASTAPI_PATH_PREFIXES):
+            return _fastapi_wsgi_app(environ, start_response)
+        return _flask_wsgi_app(environ, start_response)
 
-    except Exception as e:
-        print(f"✗ Flask reload failed: {e}")
-        return False
+    app.wsgi_app = _dispatch_wsgi
 
 
 # Register Flask reload callback with service manager
@@ -199,22 +470,12 @@ def index_old():
 @app.route('/api/stations')
 def get_stations():
     """API endpoint to get all available stations"""
-    if parser is None:
-        return jsonify([])
-
-    stations = []
-    for stop in parser.stops.values():
-        stations.append({
-            'id': stop.stop_id,
-            'name': stop.stop_name,
-            'platform': stop.platform_code,
-            'lat': stop.stop_lat,
-            'lon': stop.stop_lon
-        })
-
-    # Sort by name
-    stations.sort(key=lambda x: x['name'])
-    return jsonify(stations)
+    stations_json = _state['stations_json']
+    if stations_json is None:
+        return ojsonify([])
+
+    # Payload is built once at load/reload time (stations sorted by name)
+    return Response(stations_json, mimetype='application/json')
 
 @app.route('/api/stations/autocomplete')
 def autocomplete_stations():
@@ -225,17 +486,32 @@ def autocomplete_stations():
         q: Search query (partial station name)
         limit: Maximum number of results (default: 10)
     """
-    if parser is None or stop_index is None:
-        return jsonify([])
+    state = _state
+    if state['parser'] is None or state['stop_index'] is None:
+        return ojsonify([])
 
     query = request.args.get('q', '').strip()
     limit = int(request.args.get('limit', 10))
 
     if not query or len(query) < 2:
-        return jsonify([])
+        return ojsonify([])
 
-    # Use fuzzy matching to find similar station names
-    matches = stop_index.find_stop_fuzzy(query, limit=limit, min_score=60)
+    response = Response(state['autocomplete'](query.lower(), limit), mimetype='application/json')
+    response.headers['Cache-Control'] = 'max-age=300'
+    return response
+
+
+def _autocomplete(state, query_lower, limit):
+    """
+    Fuzzy-match station names and return the serialized suggestions.
+
+    Cached per state generation (as state['autocomplete']) on (query, limit),
+    since users retype the same prefixes.
+    """
+    matches = _prefix_matches(state, query_lower, limit)
+    if len(matches) < limit:
+        # Not enough names start with the query - fall back to a full fuzzy scan
+        matches = state['stop_index'].find_stop_fuzzy(query_lower, limit=limit, min_score=60)
 
     suggestions = []
     seen_names = set()  # Avoid duplicate names
@@ -251,77 +527,111 @@ def autocomplete_stations():
             })
             seen_names.add(stop.stop_name)
 
-    return jsonify(suggestions)
+    return orjson.dumps(suggestions)
+
+
+def _prefix_matches(state, query_lower, limit):
+    """
+    Score only station names starting with the query.
+
+    Uses bisect on the sorted name list, collecting up to limit*4 candidates
+    before fuzzy-scoring them, so work is independent of the number of stops.
+    """
+    station_names = state['station_names']
+    station_by_name = state['station_by_name']
+
+    candidates = []
+    i = bisect.bisect_left(station_names, query_lower)
+    while i < len(station_names) and len(candidates) < limit * 4:
+        name = station_names[i]
+        if not name.startswith(query_lower):
+            break
+        candidates.append(name)
+        i += 1
+
+    scored = [
+        (station_by_name[name], fuzz.WRatio(query_lower, name))
+        for name in candidates
+    ]
+    scored.sort(key=itemgetter(1), reverse=True)
+    return scored[:limit]
+
+def _fuzzy_stop_id(state, name_lower):
+    """
+    Fuzzy-match a journey origin/destination name to its best stop ID.
+
+    Cached per state generation as state['fuzzy_stop_id'].
+    """
+    matches = state['stop_index'].find_stop_fuzzy(name_lower, limit=1, min_score=50)
+    return matches[0][0].stop_id if matches else None
+
+
+def _resolve_stop(state, name):
+    """
+    Resolve a station name typed by the user to a stop.
+
+    The exact name lookup is a dict hit, so it is tried before falling
+    back to (cached) fuzzy matching.
+
+    Returns:
+        Stop, or None if nothing matches
+    """
+    stop = state['stop_index'].find_stop_exact(name)
+    if stop:
+        return stop
+
+    stop_id = state['fuzzy_stop_id'](name.lower())
+    return state['parser'].stops.get(stop_id) if stop_id else None
+
 
 @app.route('/api/plan', methods=['POST'])
 def plan_journey_endpoint():
     """API endpoint to plan journeys across all transport modes"""
-    print("\n=== Multi-Modal Journey Planning Request ===")
+    state = _state
+    parser = state['parser']
+    planner = state['planner']
+    stop_index = state['stop_index']
+    stop_coords = state['stop_coords']
 
     if planner is None or stop_index is None:
-        print("ERROR: GTFS data not loaded")
-        return jsonify({'error': 'GTFS data not loaded. Journey planning unavailable.'}), 503
+        logger.error("Journey planning requested but GTFS data not loaded")
+        return ojsonify({'error': 'GTFS data not loaded. Journey planning unavailable.'}), 503
 
     try:
         data = request.get_json()
-        print(f"Request data: {data}")
 
         origin_name = data.get('origin', '').strip()
         destination_name = data.get('destination', '').strip()
         # Time is optional now - uses current time if not provided
         time_str = data.get('time', '').strip()
 
-        print(f"Origin: '{origin_name}'")
-        print(f"Destination: '{destination_name}'")
-
         if not origin_name or not destination_name:
-            print("ERROR: Missing origin or destination")
-            return jsonify({'error': 'Origin and destination are required'}), 400
-
-        # Find origin stop using fuzzy matching
-        print(f"Searching for origin: {origin_name}")
-        origin_matches = stop_index.find_stop_fuzzy(origin_name, limit=5, min_score=50)
-        print(f"Origin matches: {[(s.stop_name, score) for s, score in origin_matches]}")
-
-        if not origin_matches:
-            origin_stop = stop_index.find_stop_exact(origin_name)
-            if not origin_stop:
-                print(f"ERROR: Origin station '{origin_name}' not found")
-                return jsonify({'error': f'Origin station "{origin_name}" not found'}), 404
-        else:
-            origin_stop = origin_matches[0][0]
+            return ojsonify({'error': 'Origin and destination are required'}), 400
 
-        print(f"✓ Origin found: {origin_stop.stop_name} (ID: {origin_stop.stop_id})")
+        # Resolve origin/destination (exact name first, then fuzzy)
+        origin_stop = _resolve_stop(state, origin_name)
+        if origin_stop is None:
+            return ojsonify({'error': f'Origin station "{origin_name}" not found'}), 404
 
-        # Find destination stop using fuzzy matching
-        print(f"Searching for destination: {destination_name}")
-        dest_matches = stop_index.find_stop_fuzzy(destination_name, limit=5, min_score=50)
-        print(f"Destination matches: {[(s.stop_name, score) for s, score in dest_matches]}")
+        logger.debug("Origin resolved: %s (ID: %s)", origin_stop.stop_name, origin_stop.stop_id)
 
-        if not dest_matches:
-            dest_stop = stop_index.find_stop_exact(destination_name)
-            if not dest_stop:
-                print(f"ERROR: Destination station '{destination_name}' not found")
-                return jsonify({'error': f'Destination station "{destination_name}" not found'}), 404
-        else:
-            dest_stop = dest_matches[0][0]
+        dest_stop = _resolve_stop(state, destination_name)
+        if dest_stop is None:
+            return ojsonify({'error': f'Destination station "{destination_name}" not found'}), 404
 
-        print(f"✓ Destination found: {dest_stop.stop_name} (ID: {dest_stop.stop_id})")
+        logger.debug("Destination resolved: %s (ID: %s)", dest_stop.stop_name, dest_stop.stop_id)
 
         # Parse departure time or use current time
         if not time_str or time_str.lower() == 'now':
             departure_time = None  # Let the planner use current time
-            print(f"Using current time for departure")
         else:
             # Handle HH:MM format
             if len(time_str.split(':')) == 2:
                 departure_time = f"{time_str}:00"
             else:
                 departure_time = time_str
-            print(f"Departure time: {departure_time}")
 
         # Find single best journey using two-tier search
-        print(f"Finding best journey from {origin_stop.stop_id} to {dest_stop.stop_id}...")
         journey = planner.find_best_journey(
             origin_stop_id=origin_stop.stop_id,
             destination_stop_id=dest_stop.stop_id,
@@ -329,14 +639,30 @@ def plan_journey_endpoint():
             max_transfers=4
         )
 
-        # Helper function to convert journey to JSON
+        # Helper functions to convert journey to JSON
+        def coords_for(stop_id):
+            coords = stop_coords.get(stop_id)
+            if coords is None:
+                return None
+            return {'lat': coords[0], 'lon': coords[1], 'id': stop_id}
+
+        def intermediate_arrays(leg):
+            # Stops without coordinates are skipped, so names travel in the
+            # same arrays to keep every index aligned
+            ids, names, lats, lons = [], [], [], []
+            for stop_id, name in zip(leg.intermediate_stop_ids, leg.intermediate_stops):
+                coords = stop_coords.get(stop_id)
+                if coords is None:
+                    continue
+                ids.append(stop_id)
+                names.append(name)
+                lats.append(coords[0])
+                lons.append(coords[1])
+            return {'ids': ids, 'names': names, 'lats': lats, 'lons': lons}
+
         def journey_to_json(journey):
             legs_data = []
             for leg in journey.legs:
-                # Get from/to stops for coordinates
-                from_stop = parser.get_stop(leg.from_stop_id)
-                to_stop = parser.get_stop(leg.to_stop_id)
-
                 leg_data = {
                     'from_stop': leg.from_stop_name,
                     'to_stop': leg.to_stop_name,
@@ -344,39 +670,31 @@ def plan_journey_endpoint():
                     'to_stop_id': leg.to_stop_id,
 
                     # Add coordinates for map rendering
-                    'from_coords': {
-                        'lat': float(from_stop.stop_lat),
-                        'lon': float(from_stop.stop_lon),
-                        'id': from_stop.stop_id
-                    } if from_stop else None,
-                    'to_coords': {
-                        'lat': float(to_stop.stop_lat),
-                        'lon': float(to_stop.stop_lon),
-                        'id': to_stop.stop_id
-                    } if to_stop else None,
+                    'from_coords': coords_for(leg.from_stop_id),
+                    'to_coords': coords_for(leg.to_stop_id),
 
                     'departure_time': leg.departure_time[:5],  # HH:MM
                     'arrival_time': leg.arrival_time[:5],  # HH:MM
                     'route_name': leg.route_name or 'Transfer',
-                    'route_id': leg.route_id if hasattr(leg, 'route_id') else None,
-                    'trip_id': leg.trip_id if hasattr(leg, 'trip_id') else None,
+                    'route_id': leg.route_id,
+                    'trip_id': leg.trip_id,
                     'mode': leg.get_mode_name(),
                     'duration_minutes': leg.duration_minutes,
                     'num_stops': leg.num_stops,
                     'is_transfer': leg.is_transfer,
                     'intermediate_stops': leg.intermediate_stops,
 
-                    # Add intermediate stop coordinates for map
-                    'intermediate_coords': leg.intermediate_coords if hasattr(leg, 'intermediate_coords') else []
+                    # Intermediate stops with coordinates for the map, as parallel arrays
+                    'intermediate': intermediate_arrays(leg)
                 }
 
                 # Add transfer-specific info if available
                 if leg.is_transfer:
-                    if hasattr(leg, 'from_platform') and leg.from_platform:
+                    if leg.from_platform:
                         leg_data['from_platform'] = leg.from_platform
-                    if hasattr(leg, 'to_platform') and leg.to_platform:
+                    if leg.to_platform:
                         leg_data['to_platform'] = leg.to_platform
-                    if hasattr(leg, 'transfer_hub_name') and leg.transfer_hub_name:
+                    if leg.transfer_hub_name:
                         leg_data['transfer_hub_name'] = leg.transfer_hub_name
 
                 legs_data.append(leg_data)
@@ -423,24 +741,22 @@ def plan_journey_endpoint():
 
         # Log results
         if journey:
-            modes = ' → '.join(journey.get_modes_used())
-            print(f"✓ Found route: {journey.duration_minutes}m, {journey.num_transfers} transfers, {modes}")
+            logger.debug(
+                "Found route %s -> %s: %sm, %s transfers",
+                origin_stop.stop_id, dest_stop.stop_id,
+                journey.duration_minutes, journey.num_transfers
+            )
         else:
-            print("✗ No route found")
+            logger.info("No route found from %s to %s", origin_stop.stop_id, dest_stop.stop_id)
 
-        print("=== Multi-Modal Journey Planning Success ===\n")
-        return jsonify(result)
+        return ojsonify(result)
 
     except ValueError as e:
-        print(f"ERROR: ValueError - {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return jsonify({'error': str(e)}), 400
+        logger.exception("Invalid journey planning request")
+        return ojsonify({'error': str(e)}), 400
     except Exception as e:
-        print(f"ERROR: Unexpected error - {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return jsonify({'error': f'Unexpected error: {str(e)}'}), 500
+        logger.exception("Unexpected error while planning journey")
+        return ojsonify({'error': f'Unexpected error: {str(e)}'}), 500
 
 @app.route('/map')
 def map_page():
@@ -480,49 +796,102 @@ def get_vehicles():
         mode: Transport mode (metro, vline, tram, bus)
     """
     mode = request.args.get('mode', 'metro')
+    if mode not in VEHICLE_MODES:
+        return ojsonify({
+            'success': False,
+            'error': f'Invalid mode: {mode}',
+            'vehicles': []
+        }), 400
 
     try:
-        response = requests.get(
-            f'{FASTAPI_URL}/api/v1/vehicles',
-            params={'mode': mode},
-            timeout=10
-        )
+        status_code, content = _stream_backend_cached(_vehicle_cache, '/api/v1/vehicles', mode)
 
-        if response.status_code == 200:
-            return jsonify(response.json())
-        elif response.status_code == 503:
-            return jsonify({
+        if status_code == 200:
+            return Response(content, status=200, mimetype='application/json')
+        elif status_code == 503:
+            return ojsonify({
                 'success': False,
                 'error': 'Realtime data not available. FastAPI server may not be running or PTV API key not configured.',
                 'vehicles': []
             }), 503
         else:
-            return jsonify({
+            return ojsonify({
                 'success': False,
-                'error': f'Backend returned status {response.status_code}',
+                'error': f'Backend returned status {status_code}',
                 'vehicles': []
-            }), response.status_code
+            }), status_code
 
     except requests.exceptions.ConnectionError:
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': 'Cannot connect to FastAPI backend. Is it running on port 8000?',
             'vehicles': []
         }), 503
     except requests.exceptions.Timeout:
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': 'Request to backend timed out',
             'vehicles': []
         }), 504
     except Exception as e:
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': f'Unexpected error: {str(e)}',
             'vehicles': []
         }), 500
 
 
+@app.route('/api/vehicles/batch')
+def get_vehicles_batch():
+    """
+    Proxy endpoint to get live vehicle positions for several modes at once.
+
+    Upstream requests are made in parallel, so the response time is that
+    of the slowest mode rather than the sum of all of them.
+
+    Query params:
+        modes: Comma-separated transport modes (default: metro,vline,tram,bus)
+    """
+    modes = [m.strip() for m in request.args.get('modes', ','.join(VEHICLE_MODES)).split(',') if m.strip()]
+    invalid = [m for m in modes if m not in VEHICLE_MODES]
+    if invalid:
+        return ojsonify({
+            'success': False,
+            'error': f'Invalid mode(s): {", ".join(invalid)}'
+        }), 400
+
+    def fetch(mode):
+        try:
+            status_code, content = _fetch_backend_cached(_vehicle_cache, '/api/v1/vehicles', mode)
+            if status_code == 200:
+                return orjson.loads(content)
+            return {
+                'success': False,
+                'error': f'Backend returned status {status_code}',
+                'vehicles': []
+            }
+        except requests.exceptions.ConnectionError:
+            return {
+                'success': False,
+                'error': 'Cannot connect to FastAPI backend. Is it running on port 8000?',
+                'vehicles': []
+            }
+        except requests.exceptions.Timeout:
+            return {
+                'success': False,
+                'error': 'Request to backend timed out',
+                'vehicles': []
+            }
+
+    with ThreadPoolExecutor(max_workers=len(VEHICLE_MODES)) as executor:
+        results = dict(zip(modes, executor.map(fetch, modes)))
+
+    return ojsonify({
+        'success': any(r.get('success') for r in results.values()),
+        'modes': results
+    })
+
+
 @app.route('/api/vehicles/summary')
 def get_vehicles_summary():
     """
@@ -534,27 +903,23 @@ def get_vehicles_summary():
     mode = request.args.get('mode', 'metro')
 
     try:
-        response = requests.get(
-            f'{FASTAPI_URL}/api/v1/vehicles/summary',
-            params={'mode': mode},
-            timeout=10
-        )
+        status_code, content = _call_backend('/api/v1/vehicles/summary', mode)
 
-        if response.status_code == 200:
-            return jsonify(response.json())
+        if status_code == 200:
+            return Response(content, status=200, mimetype='application/json')
         else:
-            return jsonify({
+            return ojsonify({
                 'success': False,
-                'error': f'Backend returned status {response.status_code}'
-            }), response.status_code
+                'error': f'Backend returned status {status_code}'
+            }), status_code
 
     except requests.exceptions.ConnectionError:
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': 'Cannot connect to FastAPI backend'
         }), 503
     except Exception as e:
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': str(e)
         }), 500
@@ -569,31 +934,33 @@ def get_alerts():
         mode: Transport mode (metro, tram - only these have alerts from PTV)
     """
     mode = request.args.get('mode', 'metro')
+    if mode not in VEHICLE_MODES:
+        return ojsonify({
+            'success': False,
+            'error': f'Invalid mode: {mode}',
+            'alerts': []
+        }), 400
 
     try:
-        response = requests.get(
-            f'{FASTAPI_URL}/api/v1/alerts',
-            params={'mode': mode},
-            timeout=10
-        )
+        status_code, content = _fetch_backend_cached(_alerts_cache, '/api/v1/alerts', mode)
 
-        if response.status_code == 200:
-            return jsonify(response.json())
+        if status_code == 200:
+            return Response(content, status=200, mimetype='application/json')
         else:
-            return jsonify({
+            return ojsonify({
                 'success': False,
-                'error': f'Backend returned status {response.status_code}',
+                'error': f'Backend returned status {status_code}',
                 'alerts': []
-            }), response.status_code
+            }), status_code
 
     except requests.exceptions.ConnectionError:
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': 'Cannot connect to FastAPI backend. Is it running on port 8000?',
             'alerts': []
         }), 503
     except Exception as e:
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': str(e),
             'alerts': []
@@ -601,8 +968,9 @@ def get_alerts():
 
 
 if __name__ == '__main__':
-    # Start FastAPI backend first
-    start_fastapi_backend()
+    # Start FastAPI backend first (unless it is served in-process)
+    if not EMBED_FASTAPI:
+        start_fastapi_backend()
 
     # Use port 5001 by default (5000 is often used by AirPlay on macOS)
     port = int(os.environ.get('FLASK_PORT', 5001))
@@ -613,12 +981,19 @@ if __name__ == '__main__':
     print(f"✓ Web interface: http://localhost:{port}")
     print(f"✓ Journey Planner: http://localhost:{port}")
     print(f"✓ About & API Docs: http://localhost:{port}/about")
-    print(f"✓ Swagger UI: http://localhost:8000/docs")
+    print(f"✓ Swagger UI: http://localhost:{port if EMBED_FASTAPI else 8000}/docs")
     print("="*60)
     print("\nPress CTRL+C to stop both servers\n")
 
     try:
-        app.run(debug=True, host='0.0.0.0', port=port, use_reloader=False)
+        if os.environ.get('FLASK_ENV') == 'development':
+            app.run(debug=True, host='0.0.0.0', port=port, use_reloader=False)
+        else:
+            # Multi-threaded WSGI server so slow backend/planning calls don't
+            # block other requests. Single process, so the loaded GTFS data
+            # is shared by all threads.
+            from waitress import serve
+            serve(app, host='0.0.0.0', port=port, threads=int(os.environ.get('FLASK_THREADS', 8)))
     except KeyboardInterrupt:
         print("\n\nShutting down...")
         stop_fastapi_backend()
@@ -3,9 +3,8 @@
 
 import sys
 if sys.platform == 'win32':
-    import codecs
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
+    sys.stdout.reconfigure(encoding='utf-8', errors='strict')
+    sys.stderr.reconfigure(encoding='utf-8', errors='strict')
 
 from src.data.multimodal_parser import MultiModalGTFSParser
 from src.graph.unified_transit_graph import UnifiedTransitGraph
@@ -37,27 +36,20 @@ for i, conn in enumerate(all_connections[:10]):
         if from_stop and to_stop:
             print(f"   {from_stop.stop_name} → {to_stop.stop_name}")
 
-# Check if ALL transfers come first
-transfer_count = 0
-regular_count = 0
-first_regular_index = None
-
-for i, conn in enumerate(all_connections):
-    if conn.is_transfer:
-        transfer_count += 1
-        if regular_count > 0:
-            print(f"\n⚠️  WARNING: Transfer found AFTER regular connection at index {i}")
-            break
-    else:
-        regular_count += 1
-        if first_regular_index is None:
-            first_regular_index = i
-
-print(f"\n✓ All {transfer_count:,} transfers come before regular connections")
-print(f"✓ First regular connection at index: {first_regular_index:,}")
-
-if first_regular_index:
+# Transfers are sorted after all regular connections; the graph tracks the boundary
+first_transfer_index = graph.get_first_transfer_index()
+regular_count = first_transfer_index
+transfer_count = len(all_connections) - first_transfer_index
+
+misplaced = sum(1 for conn in all_connections[:first_transfer_index] if conn.is_transfer)
+if misplaced:
+    print(f"\n⚠️  WARNING: {misplaced:,} transfers found among regular connections")
+else:
+    print(f"\n✓ All {regular_count:,} regular connections come before {transfer_count:,} transfers")
+print(f"✓ First transfer connection at index: {first_transfer_index:,}")
+
+if regular_count:
     print(f"\nFirst regular connection:")
-    conn = all_connections[first_regular_index]
+    conn = all_connections[0]
     print(f"  Time: {conn.departure_time} → {conn.arrival_time}")
     print(f"  Trip: {conn.trip_id}")
@@ -3,9 +3,10 @@
 
 import sys
 if sys.platform == 'win32':
-    import codecs
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
+    sys.stdout.reconfigure(encoding='utf-8', errors='strict')
+    sys.stderr.reconfigure(encoding='utf-8', errors='strict')
+
+import numpy as np
 
 from src.data.multimodal_parser import MultiModalGTFSParser
 
@@ -13,8 +14,21 @@ from src.data.multimodal_parser import MultiModalGTFSParser
 parser = MultiModalGTFSParser(base_gtfs_dir="data/gtfs", modes_to_load=['1', '2', '3'])
 parser.load_all()
 
+# Lowercased names as a NumPy string array for vectorized substring search
+stop_ids = np.array(list(parser.stops.keys()))
+names_lc = np.char.lower(np.array([s.stop_name for s in parser.stops.values()], dtype='U'))
+
+
+def stops_matching(*terms):
+    """Return stops whose lowercased name contains every term."""
+    mask = np.ones(len(names_lc), dtype=bool)
+    for term in terms:
+        mask &= np.char.find(names_lc, term) >= 0
+    return [parser.stops[sid] for sid in stop_ids[mask]]
+
+
 # Find Richmond stations
-richmond_stops = [s for s in parser.stops.values() if 'richmond' in s.stop_name.lower() and 'station' in s.stop_name.lower()]
+richmond_stops = stops_matching('richmond', 'station')
 
 print("=" * 70)
 print(f"Found {len(richmond_stops)} Richmond Station stops")
@@ -77,7 +91,7 @@ print("\n" + "=" * 70)
 print("Checking Tarneit (known working station):")
 print("=" * 70)
 
-tarneit_stops = [s for s in parser.stops.values() if 'tarneit' in s.stop_name.lower()]
+tarneit_stops = stops_matching('tarneit')
 for stop in tarneit_stops[:2]:
     mode_id = parser.get_mode_for_stop(stop.stop_id)
     if mode_id:
@@ -8,22 +8,35 @@ if sys.platform == 'win32':
     sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
 
 from src.data.gtfs_parser import GTFSParser
+from src.utils.gtfs_cache import load_cached
 
 print("="*60)
 print("Analyzing V/Line trips: Richmond → Waurn Ponds")
 print("="*60)
 
-# Load V/Line data only (folder 1)
-parser = GTFSParser('data/gtfs/1')
-parser.load_all()
+def load_parser():
+    parser = GTFSParser('data/gtfs/1')
+    parser.load_all()
+    return parser
+
+
+# Load V/Line data only (folder 1), reusing the on-disk cache when unchanged
+parser = load_cached('data/gtfs/1', load_parser, name='vline-parser')
 
 print(f"\n✓ Loaded {len(parser.stops)} stops")
 print(f"✓ Loaded {len(parser.routes)} routes")
 print(f"✓ Loaded {len(parser.trips)} trips")
 
 # Find Richmond and Waurn Ponds stop IDs
-richmond_stops = [s for s in parser.stops.values() if 'richmond' in s.stop_name.lower() and 'station' in s.stop_name.lower()]
-waurn_stops = [s for s in parser.stops.values() if 'waurn' in s.stop_name.lower()]
+# (single pass, lowercasing each name once)
+richmond_stops = []
+waurn_stops = []
+for s in parser.stops.values():
+    name_lower = s.stop_name.lower()
+    if 'richmond' in name_lower and 'station' in name_lower:
+        richmond_stops.append(s)
+    if 'waurn' in name_lower:
+        waurn_stops.append(s)
 
 print(f"\nRichmond Station variants: {len(richmond_stops)}")
 for s in richmond_stops[:3]:
@@ -38,31 +51,34 @@ print("\n" + "="*60)
 print("Checking which trips serve Richmond Station...")
 print("="*60)
 
-richmond_stop_ids = {s.stop_id for s in richmond_stops}
-trips_via_richmond = set()
-
+# Build a stop -> trips inverted index once, so "which trips serve X"
+# becomes a dict lookup instead of a scan over every trip
+stop_to_trips = {}
 for trip_id, stop_times in parser.stop_times.items():
-    stop_ids_in_trip = {st.stop_id for st in stop_times}
-    if richmond_stop_ids & stop_ids_in_trip:  # Intersection
-        trips_via_richmond.add(trip_id)
+    for st in stop_times:
+        stop_to_trips.setdefault(st.stop_id, set()).add(trip_id)
+
+
+def trips_serving(stop_ids):
+    """Return IDs of trips that call at any of the given stops."""
+    return set().union(*(stop_to_trips.get(sid, ()) for sid in stop_ids))
+
+
+richmond_stop_ids = {s.stop_id for s in richmond_stops}
+trips_via_richmond = trips_serving(richmond_stop_ids)
 
 print(f"\nTrips serving Richmond: {len(trips_via_richmond)}")
 
 # Check which of those trips also serve Waurn Ponds
 waurn_stop_ids = {s.stop_id for s in waurn_stops}
-trips_via_both = set()
-
-for trip_id in trips_via_richmond:
-    stop_times = parser.stop_times.get(trip_id, [])
-    stop_ids_in_trip = {st.stop_id for st in stop_times}
-    if waurn_stop_ids & stop_ids_in_trip:
-        trips_via_both.add(trip_id)
+trips_via_waurn = trips_serving(waurn_stop_ids)
+trips_via_both = trips_via_richmond & trips_via_waurn
 
 print(f"Trips serving BOTH Richmond AND Waurn Ponds: {len(trips_via_both)}")
 
 if trips_via_both:
     print("\n✓ Direct trips exist! Let's examine one:")
-    sample_trip_id = list(trips_via_both)[0]
+    sample_trip_id = next(iter(trips_via_both))
     trip = parser.get_trip(sample_trip_id)
     route = parser.get_route(trip.route_id)
 
@@ -103,12 +119,6 @@ else:
     print("\n" + "="*60)
     print("Routes serving Waurn Ponds:")
     print("="*60)
-    trips_via_waurn = set()
-    for trip_id, stop_times in parser.stop_times.items():
-        stop_ids_in_trip = {st.stop_id for st in stop_times}
-        if waurn_stop_ids & stop_ids_in_trip:
-            trips_via_waurn.add(trip_id)
-
     waurn_routes = set()
     for trip_id in trips_via_waurn:
         trip = parser.get_trip(trip_id)
@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 """Debug script to check transfer hub detection and connections."""
 
+import re
 import sys
+from collections import defaultdict
+
 if sys.platform == 'win32':
     import codecs
     sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
@@ -9,24 +12,45 @@ if sys.platform == 'win32':
 
 from src.data.multimodal_parser import MultiModalGTFSParser
 from src.graph.unified_transit_graph import UnifiedTransitGraph
+from src.utils.gtfs_cache import load_cached
 
 print("=" * 70)
 print("Transfer Hub Detection Diagnostics")
 print("=" * 70)
 
-# Load data
-parser = MultiModalGTFSParser(base_gtfs_dir="data/gtfs", modes_to_load=['1', '2', '3'])
-parser.load_all()
+def build():
+    parser = MultiModalGTFSParser(base_gtfs_dir="data/gtfs", modes_to_load=['1', '2', '3'])
+    parser.load_all()
+
+    # Build unified graph
+    print("\n🔧 Building unified transit graph...")
+    return parser, UnifiedTransitGraph(parser)
 
-print(f"\n✓ Loaded {len(parser.stops)} stops")
 
-# Build unified graph
-print("\n🔧 Building unified transit graph...")
-graph = UnifiedTransitGraph(parser)
+# Load data and graph (from the on-disk cache when GTFS files are unchanged)
+parser, graph = load_cached("data/gtfs", build, name="unified-graph-1-2-3")
+
+print(f"\n✓ Loaded {len(parser.stops)} stops")
 
 # Get transfer hubs
 hubs = graph.get_transfer_hubs()
 
+# Invert once so per-stop hub checks are plain dict lookups
+stop_to_hub = {}
+for hub_name, stop_ids in hubs.items():
+    for stop_id in stop_ids:
+        stop_to_hub.setdefault(stop_id, hub_name)
+
+# Resolve each stop's mode name once; both loops below only need the name
+mode_names = {}
+stop_mode_name = {}
+for stop_id in parser.stops:
+    mode_id = parser.get_mode_for_stop(stop_id)
+    if mode_id:
+        if mode_id not in mode_names:
+            mode_names[mode_id] = parser.get_mode_info(mode_id)['name']
+        stop_mode_name[stop_id] = mode_names[mode_id]
+
 print(f"\n📍 Found {len(hubs)} transfer hubs:")
 print()
 
@@ -35,12 +59,7 @@ for hub_name, stop_ids in sorted(hubs.items()):
     print(f"  Number of stops: {len(stop_ids)}")
 
     # Show modes at this hub
-    modes = set()
-    for stop_id in stop_ids:
-        mode_id = parser.get_mode_for_stop(stop_id)
-        if mode_id:
-            mode_info = parser.get_mode_info(mode_id)
-            modes.add(mode_info['name'])
+    modes = {stop_mode_name[sid] for sid in stop_ids if sid in stop_mode_name}
 
     print(f"  Modes: {', '.join(sorted(modes))}")
 
@@ -61,26 +80,32 @@ print("=" * 70)
 
 key_stations = ['Richmond', 'Southern Cross', 'Flinders Street', 'Melbourne Central']
 
+# Index stops by lowercase name word once, so each station lookup only
+# checks stops sharing its first word instead of every stop
+stops_by_word = defaultdict(list)
+for stop in parser.stops.values():
+    name_lower = stop.stop_name.lower()
+    for word in set(re.findall(r'\w+', name_lower)):
+        stops_by_word[word].append((name_lower, stop))
+
 for station_name in key_stations:
-    matching_stops = [s for s in parser.stops.values() if station_name.lower() in s.stop_name.lower()]
+    query = station_name.lower()
+    first_word = re.findall(r'\w+', query)[0]
+    matching_stops = [stop for name_lower, stop in stops_by_word.get(first_word, ()) if query in name_lower]
 
     print(f"\n🚉 {station_name}: {len(matching_stops)} stop(s)")
 
-    modes_at_station = {}
+    modes_at_station = defaultdict(list)
     for stop in matching_stops[:10]:  # Limit to 10
-        mode_id = parser.get_mode_for_stop(stop.stop_id)
-        if mode_id:
-            mode_name = parser.get_mode_info(mode_id)['name']
-            if mode_name not in modes_at_station:
-                modes_at_station[mode_name] = []
+        mode_name = stop_mode_name.get(stop.stop_id)
+        if mode_name:
             modes_at_station[mode_name].append(stop)
 
     for mode_name, stops in modes_at_station.items():
         print(f"  {mode_name}: {len(stops)} stop(s)")
         for stop in stops[:2]:
-            is_hub = graph.is_transfer_hub(stop.stop_id)
-            hub_name = graph.get_hub_for_stop(stop.stop_id)
-            hub_status = f"✓ Hub: {hub_name}" if is_hub else "✗ Not a hub"
+            hub_name = stop_to_hub.get(stop.stop_id)
+            hub_status = f"✓ Hub: {hub_name}" if hub_name else "✗ Not a hub"
             print(f"    - {stop.stop_name} ({stop.stop_id}) - {hub_status}")
 
 # Count transfer connections
@@ -88,11 +113,11 @@ print("\n" + "=" * 70)
 print("Transfer Connection Statistics")
 print("=" * 70)
 
-transfer_connections = [c for c in graph.connections if c.is_transfer]
-regular_connections = [c for c in graph.connections if not c.is_transfer]
+transfer_connections = graph.transfer_connections
+regular_connections = graph.regular_connections
 
 print(f"\n📊 Connection breakdown:")
-print(f"  Total connections: {len(graph.connections):,}")
+print(f"  Total connections: {len(regular_connections) + len(transfer_connections):,}")
 print(f"  Regular connections: {len(regular_connections):,}")
 print(f"  Transfer connections: {len(transfer_connections):,}")
 
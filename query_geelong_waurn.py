@@ -2,6 +2,7 @@ from datetime import datetime
 from src.data.multimodal_parser import MultiModalGTFSParser
 from src.data.stop_index import StopIndex
 from src.routing.journey_planner import JourneyPlanner
+from src.utils.gtfs_cache import load_cached
 import os
 
 # Optional: real-time alerts (requires PTV_API_KEY)
@@ -12,6 +13,12 @@ try:
 except ImportError:
     REALTIME_AVAILABLE = False
 
+def load_vline_parser():
+    parser = MultiModalGTFSParser(modes_to_load=['1'])
+    parser.load_all()
+    return parser
+
+
 def main():
     print("=" * 60)
     print("GEELONG -> WAURN PONDS - Next Train Query")
@@ -19,8 +26,7 @@ def main():
 
     # 1. Load GTFS data
     print("\n[1/4] Loading V/Line GTFS data...")
-    parser = MultiModalGTFSParser(modes_to_load=['1'])
-    parser.load_all()
+    parser = load_cached('data/gtfs', load_vline_parser, name='multimodal-1')
     print(f"  ✓ Loaded {len(parser.all_stops)} stops, {len(parser.all_trips)} trips")
 
     # 2. Find stations
@@ -111,8 +117,13 @@ def main():
             relevant_alerts.extend(stop_alerts_geelong)
             relevant_alerts.extend(stop_alerts_waurn)
 
-            # Remove duplicates
-            unique_alerts = {alert.id: alert for alert in relevant_alerts}.values()
+            # Remove duplicates, keeping first occurrence
+            seen_ids = set()
+            unique_alerts = []
+            for alert in relevant_alerts:
+                if alert.alert_id not in seen_ids:
+                    seen_ids.add(alert.alert_id)
+                    unique_alerts.append(alert)
 
             if unique_alerts:
                 print(f"\n⚠️  SERVICE DISRUPTIONS DETECTED ({len(unique_alerts)} alert(s)):")
@@ -9,17 +9,22 @@ This script profiles and benchmarks:
 4. Journey planning queries
 5. Fuzzy search queries
 
-Run with: python scripts/benchmark_performance.py
+Run with: python scripts/benchmark_performance.py [--profile STAGE]
+
+Pass --profile to run one stage under cProfile and dump a .prof file
+(viewable with snakeviz). Profiling is off by default because it slows
+the traced code down several times.
 """
 
+import argparse
 import time
 import sys
 import os
 import cProfile
 import pstats
-from io import StringIO
+import tempfile
 from functools import wraps
-from typing import Callable, Any, Dict, List
+from typing import Callable, Any, Dict, List, Optional
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -28,47 +33,60 @@ from src.data.gtfs_parser import GTFSParser
 from src.data.stop_index import StopIndex
 from src.graph.transit_graph import TransitGraph
 from src.routing.journey_planner import JourneyPlanner
+from src.utils.gtfs_cache import save_cache, load_cache
+
+NS_PER_SECOND = 1_000_000_000
+
+# Stages that can be selected with --profile
+PROFILE_STAGES = ('gtfs', 'index', 'graph', 'query', 'fuzzy', 'cache', 'none')
 
 
 def timer(func: Callable) -> Callable:
     """Decorator to time function execution."""
     @wraps(func)
     def wrapper(*args, **kwargs) -> Any:
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end = time.perf_counter()
-        print(f"  {func.__name__}: {end - start:.4f}s")
+        elapsed = (time.perf_counter_ns() - start) / NS_PER_SECOND
+        print(f"  {func.__name__}: {elapsed:.4f}s")
         return result
     return wrapper
 
 
-def profile_function(func: Callable, *args, **kwargs) -> tuple:
-    """Profile a function and return result with timing."""
+def profile_function(func: Callable, output_path: str, *args, **kwargs) -> Any:
+    """
+    Run a function under cProfile and dump the stats to a .prof file.
+
+    Prints the top functions by own time and returns the function's result.
+    """
     profiler = cProfile.Profile()
     profiler.enable()
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        profiler.disable()
 
-    start = time.perf_counter()
-    result = func(*args, **kwargs)
-    end = time.perf_counter()
-
-    profiler.disable()
-
-    # Get profiler stats
-    stream = StringIO()
-    stats = pstats.Stats(profiler, stream=stream)
-    stats.sort_stats('cumulative')
-    stats.print_stats(10)
+    profiler.dump_stats(output_path)
+    print(f"\n  Profile written to {output_path} (view with: snakeviz {output_path})")
+    pstats.Stats(profiler).strip_dirs().sort_stats('tottime').print_stats(15)
 
-    return result, end - start, stream.getvalue()
+    return result
 
 
 class PerformanceBenchmark:
     """Performance benchmarking suite."""
 
-    def __init__(self, gtfs_dir: str):
+    def __init__(self, gtfs_dir: str, profile_stage: Optional[str] = None):
         self.gtfs_dir = gtfs_dir
+        self.profile_stage = profile_stage if profile_stage != 'none' else None
         self.results: Dict[str, Dict] = {}
 
+    def _run_stage(self, stage: str, func: Callable, *args) -> Any:
+        """Run a benchmark stage, under cProfile only if it was selected."""
+        if self.profile_stage == stage:
+            return profile_function(func, f"benchmark_{stage}.prof", *args)
+        return func(*args)
+
     def run_all(self, verbose: bool = True) -> Dict:
         """Run all benchmarks."""
         print("=" * 60)
@@ -78,19 +96,22 @@ class PerformanceBenchmark:
         print()
 
         # 1. GTFS Parsing Benchmark
-        parser = self._benchmark_gtfs_parsing(verbose)
+        parser = self._run_stage('gtfs', self._benchmark_gtfs_parsing, verbose)
 
         # 2. Stop Index Benchmark
-        stop_index = self._benchmark_stop_index(parser, verbose)
+        stop_index = self._run_stage('index', self._benchmark_stop_index, parser, verbose)
 
         # 3. Graph Construction Benchmark
-        graph = self._benchmark_graph_construction(parser, verbose)
+        graph = self._run_stage('graph', self._benchmark_graph_construction, parser, verbose)
 
         # 4. Journey Planning Benchmark
-        planner = self._benchmark_journey_planning(parser, graph, verbose)
+        planner = self._run_stage('query', self._benchmark_journey_planning, parser, graph, verbose)
 
         # 5. Fuzzy Search Benchmark
-        self._benchmark_fuzzy_search(stop_index, verbose)
+        self._run_stage('fuzzy', self._benchmark_fuzzy_search, stop_index, verbose)
+
+        # 6. Warm Startup (pickle cache) Benchmark
+        self._run_stage('cache', self._benchmark_cached_startup, parser, graph, verbose)
 
         # Summary
         self._print_summary()
@@ -99,7 +120,7 @@ class PerformanceBenchmark:
 
     def _benchmark_gtfs_parsing(self, verbose: bool) -> GTFSParser:
         """Benchmark GTFS data parsing."""
-        print("\n[1/5] GTFS Data Parsing")
+        print("\n[1/6] GTFS Data Parsing")
         print("-" * 40)
 
         parser = GTFSParser(self.gtfs_dir)
@@ -107,37 +128,37 @@ class PerformanceBenchmark:
         # Time individual load operations
         timings = {}
 
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         parser.load_agencies()
-        timings['agencies'] = time.perf_counter() - start
+        timings['agencies'] = (time.perf_counter_ns() - start) / NS_PER_SECOND
 
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         parser.load_stops()
-        timings['stops'] = time.perf_counter() - start
+        timings['stops'] = (time.perf_counter_ns() - start) / NS_PER_SECOND
 
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         parser.load_routes()
-        timings['routes'] = time.perf_counter() - start
+        timings['routes'] = (time.perf_counter_ns() - start) / NS_PER_SECOND
 
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         parser.load_trips()
-        timings['trips'] = time.perf_counter() - start
+        timings['trips'] = (time.perf_counter_ns() - start) / NS_PER_SECOND
 
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         parser.load_stop_times()
-        timings['stop_times'] = time.perf_counter() - start
+        timings['stop_times'] = (time.perf_counter_ns() - start) / NS_PER_SECOND
 
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         parser.load_calendar()
-        timings['calendar'] = time.perf_counter() - start
+        timings['calendar'] = (time.perf_counter_ns() - start) / NS_PER_SECOND
 
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         parser.load_calendar_dates()
-        timings['calendar_dates'] = time.perf_counter() - start
+        timings['calendar_dates'] = (time.perf_counter_ns() - start) / NS_PER_SECOND
 
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         parser.load_transfers()
-        timings['transfers'] = time.perf_counter() - start
+        timings['transfers'] = (time.perf_counter_ns() - start) / NS_PER_SECOND
 
         total_time = sum(timings.values())
 
@@ -166,12 +187,12 @@ class PerformanceBenchmark:
 
     def _benchmark_stop_index(self, parser: GTFSParser, verbose: bool) -> StopIndex:
         """Benchmark stop index construction."""
-        print("\n[2/5] Stop Index Construction")
+        print("\n[2/6] Stop Index Construction")
         print("-" * 40)
 
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         stop_index = StopIndex(parser)
-        construction_time = time.perf_counter() - start
+        construction_time = (time.perf_counter_ns() - start) / NS_PER_SECOND
 
         self.results['stop_index'] = {
             'construction_time': construction_time,
@@ -186,12 +207,12 @@ class PerformanceBenchmark:
 
     def _benchmark_graph_construction(self, parser: GTFSParser, verbose: bool) -> TransitGraph:
         """Benchmark graph construction."""
-        print("\n[3/5] Transit Graph Construction")
+        print("\n[3/6] Transit Graph Construction")
         print("-" * 40)
 
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         graph = TransitGraph(parser)
-        construction_time = time.perf_counter() - start
+        construction_time = (time.perf_counter_ns() - start) / NS_PER_SECOND
 
         stats = graph.get_stats()
 
@@ -217,7 +238,7 @@ class PerformanceBenchmark:
         verbose: bool
     ) -> JourneyPlanner:
         """Benchmark journey planning queries."""
-        print("\n[4/5] Journey Planning Queries")
+        print("\n[4/6] Journey Planning Queries")
         print("-" * 40)
 
         planner = JourneyPlanner(parser, graph)
@@ -257,9 +278,9 @@ class PerformanceBenchmark:
         query_times = []
 
         for origin, dest, time_str in test_queries:
-            start = time.perf_counter()
+            start = time.perf_counter_ns()
             journey = planner.find_journey(origin, dest, time_str)
-            query_time = time.perf_counter() - start
+            query_time = (time.perf_counter_ns() - start) / NS_PER_SECOND
             query_times.append(query_time)
 
             if verbose:
@@ -288,7 +309,7 @@ class PerformanceBenchmark:
 
     def _benchmark_fuzzy_search(self, stop_index: StopIndex, verbose: bool):
         """Benchmark fuzzy search queries."""
-        print("\n[5/5] Fuzzy Search Queries")
+        print("\n[5/6] Fuzzy Search Queries")
         print("-" * 40)
 
         test_queries = [
@@ -303,9 +324,9 @@ class PerformanceBenchmark:
         query_times = []
 
         for query in test_queries:
-            start = time.perf_counter()
+            start = time.perf_counter_ns()
             results = stop_index.find_stop_fuzzy(query, limit=5)
-            query_time = time.perf_counter() - start
+            query_time = (time.perf_counter_ns() - start) / NS_PER_SECOND
             query_times.append(query_time)
 
             if verbose:
@@ -325,6 +346,35 @@ class PerformanceBenchmark:
             print(f"\n  Fuzzy Search Performance:")
             print(f"    - Avg: {avg_query_time:.6f}s ({1/avg_query_time:.0f} queries/sec)")
 
+    def _benchmark_cached_startup(self, parser: GTFSParser, graph: TransitGraph, verbose: bool):
+        """Benchmark saving/reloading parser and graph via the on-disk pickle cache."""
+        print("\n[6/6] Warm Startup (pickle cache)")
+        print("-" * 40)
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_path = os.path.join(cache_dir, "benchmark.pkl")
+
+            start = time.perf_counter_ns()
+            save_cache((parser, graph), cache_path)
+            save_time = (time.perf_counter_ns() - start) / NS_PER_SECOND
+
+            cache_size = os.path.getsize(cache_path)
+
+            start = time.perf_counter_ns()
+            load_cache(cache_path)
+            load_time = (time.perf_counter_ns() - start) / NS_PER_SECOND
+
+        self.results['cached_startup'] = {
+            'save_time': save_time,
+            'load_time': load_time,
+            'cache_size_bytes': cache_size,
+        }
+
+        if verbose:
+            print(f"  Save time: {save_time:.4f}s")
+            print(f"  Load time: {load_time:.4f}s")
+            print(f"  Cache size: {cache_size / (1024 * 1024):.1f} MB")
+
     def _print_summary(self):
         """Print benchmark summary."""
         print("\n" + "=" * 60)
@@ -343,6 +393,7 @@ class PerformanceBenchmark:
         print(f"  Stop Index:         {self.results['stop_index']['construction_time']:.4f}s")
         print(f"  Graph Construction: {self.results['graph_construction']['construction_time']:.4f}s")
         print(f"  TOTAL STARTUP:      {total_load_time:.4f}s")
+        print(f"  Warm (cached):      {self.results['cached_startup']['load_time']:.4f}s")
 
         print(f"\nQuery Performance:")
         print(f"  Journey Planning:   {self.results['journey_planning']['avg_query_time']:.4f}s avg")
@@ -366,6 +417,15 @@ class PerformanceBenchmark:
 
 def main():
     """Run performance benchmarks."""
+    arg_parser = argparse.ArgumentParser(description="Benchmark PTV Transit Assistant performance")
+    arg_parser.add_argument(
+        '--profile',
+        choices=PROFILE_STAGES,
+        default='none',
+        help="Run this stage under cProfile and write benchmark_<stage>.prof (default: none)"
+    )
+    args = arg_parser.parse_args()
+
     # Default to production GTFS directory
     gtfs_dir = os.path.join(
         os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
@@ -385,7 +445,7 @@ def main():
         print(f"Error: GTFS directory not found: {gtfs_dir}")
         sys.exit(1)
 
-    benchmark = PerformanceBenchmark(gtfs_dir)
+    benchmark = PerformanceBenchmark(gtfs_dir, profile_stage=args.profile)
     results = benchmark.run_all(verbose=True)
 
     return results
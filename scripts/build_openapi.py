@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Write the API's OpenAPI schema to a JSON file.
+
+The API loads this file instead of generating the schema at runtime when
+OPENAPI_SCHEMA_PATH points to it. Re-run after changing routes or models.
+
+Usage:
+    python scripts/build_openapi.py [output_path]
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import orjson
+
+# Always generate from the code, never from a previously built file
+os.environ.pop("OPENAPI_SCHEMA_PATH", None)
+
+from src.api.main import app
+
+
+def build_openapi(output_path: str = "openapi.json") -> Path:
+    """Generate the OpenAPI schema and write it to output_path."""
+    output_file = Path(output_path)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_file.write_bytes(orjson.dumps(app.openapi(), option=orjson.OPT_INDENT_2))
+    return output_file
+
+
+if __name__ == "__main__":
+    output = sys.argv[1] if len(sys.argv) > 1 else "openapi.json"
+    print(f"✓ OpenAPI schema written to {build_openapi(output)}")
@@ -9,6 +9,11 @@ import sys
 import os
 from pathlib import Path
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.http import get_http_session
+
 # Fix Windows console encoding
 if sys.platform == 'win32':
     import codecs
@@ -28,11 +33,11 @@ def download_gtfs(output_path: str = "../data/gtfs.zip"):
     print(f"Output: {output_file.absolute()}")
     
     try:
-        response = requests.get(GTFS_URL, stream=True, timeout=300)
+        response = get_http_session().get(GTFS_URL, stream=True, timeout=300)
         response.raise_for_status()
         
         total_size = int(response.headers.get('content-length', 0))
-        block_size = 8192
+        block_size = 1 << 16  # 64 KB
         downloaded = 0
         
         with open(output_file, 'wb') as f:
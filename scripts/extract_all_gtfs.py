@@ -5,6 +5,7 @@ Extract and merge all GTFS feeds from PTV GTFS ZIP.
 
 import zipfile
 import csv
+import io
 import shutil
 from pathlib import Path
 from collections import defaultdict
@@ -38,23 +39,26 @@ def extract_all_gtfs(gtfs_zip_path: str, output_dir: str):
             main_zip.extract(transit_zip, temp_dir)
             transit_zip_path = temp_dir / transit_zip
             
-            route_dir = temp_dir / f"route_{route_type}"
-            route_dir.mkdir(exist_ok=True)
-            
-            with zipfile.ZipFile(transit_zip_path, 'r') as tz:
-                tz.extractall(route_dir)
-            
             row_count = 0
-            for txt_file in route_dir.glob('*.txt'):
-                filename = txt_file.name
-                
-                with open(txt_file, 'r', encoding='utf-8-sig') as f:
-                    reader = csv.DictReader(f)
-                    rows = list(reader)
-                    row_count += len(rows)
+            # Read each CSV straight out of the archive instead of
+            # extracting it to disk and reading it back
+            with zipfile.ZipFile(transit_zip_path, 'r') as tz:
+                for member in tz.infolist():
+                    filename = Path(member.filename).name
+                    if member.is_dir() or not filename.endswith('.txt'):
+                        continue
                     
-                    all_data[filename]['headers'].update(reader.fieldnames or [])
-                    all_data[filename]['rows'].extend(rows)
+                    with tz.open(member) as raw:
+                        f = io.TextIOWrapper(raw, encoding='utf-8-sig', newline='')
+                        reader = csv.DictReader(f)
+                        rows = list(reader)
+                        row_count += len(rows)
+                        
+                        all_data[filename]['headers'].update(reader.fieldnames or [])
+                        all_data[filename]['rows'].extend(rows)
+            
+            # Nested archive is no longer needed
+            transit_zip_path.unlink()
             
             print(f"{row_count:,} rows")
         
@@ -7,12 +7,14 @@ Command-line interface for managing GTFS data updates.
 Usage:
     python scripts/gtfs_update.py --update-all
     python scripts/gtfs_update.py --modes 1,2,3
+    python scripts/gtfs_update.py --update-all --parallel
     python scripts/gtfs_update.py --status
     python scripts/gtfs_update.py --history
 """
 
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
@@ -20,13 +22,50 @@ from datetime import datetime
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.data.gtfs_downloader import GTFSDownloader
-from src.data.gtfs_scheduler import initialize_gtfs_scheduler
-from src.data.service_manager import get_service_manager
+# GTFS modules are imported inside each command so that --help and the
+# lighter commands only load what they use
+
+
+def run_updates_parallel(scheduler, modes, max_workers: int = 8) -> dict:
+    """
+    Update each mode on its own worker thread.
+
+    Downloads and extraction are I/O bound, so total time approaches the
+    slowest single mode rather than the sum over modes.
+
+    Args:
+        scheduler: GTFS scheduler
+        modes: Modes to update (None for all configured modes)
+        max_workers: Upper bound on concurrent downloads
+
+    Returns:
+        Dict mapping mode to its result, as returned by run_update_now()
+    """
+    modes = list(modes or scheduler.modes_to_update)
+    if not modes:
+        return {}
+
+    result = {}
+    with ThreadPoolExecutor(max_workers=min(len(modes), max_workers)) as executor:
+        futures = {
+            executor.submit(scheduler.run_update_now, modes=[mode]): mode
+            for mode in modes
+        }
+        for future in as_completed(futures):
+            mode = futures[future]
+            try:
+                result.update(future.result())
+            except Exception as e:
+                result[mode] = {'success': False, 'error': str(e)}
+
+    # Report in the order the modes were requested
+    return {mode: result[mode] for mode in modes if mode in result}
 
 
 def update_command(args):
     """Execute GTFS update."""
+    from src.data.gtfs_scheduler import initialize_gtfs_scheduler
+
     print("GTFS Data Update Tool")
     print("="*60)
 
@@ -41,7 +80,10 @@ def update_command(args):
         print(f"Updating all configured modes\n")
 
     # Run update
-    result = scheduler.run_update_now(modes=modes)
+    if args.parallel:
+        result = run_updates_parallel(scheduler, modes)
+    else:
+        result = scheduler.run_update_now(modes=modes)
 
     # Print results
     print("\nUpdate Results:")
@@ -75,9 +117,24 @@ def update_command(args):
         sys.exit(1)
 
 
+def _fmt_delta(delta) -> str:
+    """Format a timedelta as its largest whole unit, e.g. '3 days' or '12 minutes'."""
+    days, remainder = divmod(int(delta.total_seconds()), 86400)
+    if days > 0:
+        return f"{days} days"
+    hours, remainder = divmod(remainder, 3600)
+    if hours > 0:
+        return f"{hours} hours"
+    return f"{remainder // 60} minutes"
+
+
 def status_command(args):
     """Show update status."""
+    from src.data.gtfs_scheduler import initialize_gtfs_scheduler
+    from src.data.service_manager import get_service_manager
+
     scheduler = initialize_gtfs_scheduler()
+    now = datetime.now()
 
     print("GTFS Update Status")
     print("="*60)
@@ -85,34 +142,16 @@ def status_command(args):
     # Last update time
     last_update = scheduler.get_last_update_time()
     if last_update:
-        time_ago = datetime.now() - last_update
-        days_ago = time_ago.days
-        hours_ago = time_ago.seconds // 3600
-
-        print(f"Last update: {last_update.strftime('%Y-%m-%d %H:%M:%S')}")
-        if days_ago > 0:
-            print(f"             ({days_ago} days ago)")
-        elif hours_ago > 0:
-            print(f"             ({hours_ago} hours ago)")
-        else:
-            print(f"             ({time_ago.seconds // 60} minutes ago)")
+        print(f"Last update: {last_update:%Y-%m-%d %H:%M:%S}")
+        print(f"             ({_fmt_delta(now - last_update)} ago)")
     else:
         print("Last update: Never")
 
     # Next scheduled update
     next_update = scheduler.get_next_update_time()
     if next_update:
-        time_until = next_update - datetime.now()
-        days_until = time_until.days
-        hours_until = time_until.seconds // 3600
-
-        print(f"\nNext update: {next_update.strftime('%Y-%m-%d %H:%M:%S')}")
-        if days_until > 0:
-            print(f"             (in {days_until} days)")
-        elif hours_until > 0:
-            print(f"             (in {hours_until} hours)")
-        else:
-            print(f"             (in {time_until.seconds // 60} minutes)")
+        print(f"\nNext update: {next_update:%Y-%m-%d %H:%M:%S}")
+        print(f"             (in {_fmt_delta(next_update - now)})")
     else:
         print("\nNext update: Not scheduled (auto-update disabled)")
 
@@ -146,6 +185,8 @@ def status_command(args):
 
 def history_command(args):
     """Show update history."""
+    from src.data.gtfs_scheduler import initialize_gtfs_scheduler
+
     scheduler = initialize_gtfs_scheduler()
 
     print("GTFS Update History")
@@ -192,6 +233,9 @@ Examples:
   # Update specific modes
   python scripts/gtfs_update.py --modes 1,2,3
 
+  # Update all modes concurrently
+  python scripts/gtfs_update.py --update-all --parallel
+
   # Check update status
   python scripts/gtfs_update.py --status
 
@@ -218,6 +262,11 @@ Examples:
         type=str,
         help='Comma-separated list of modes to update (e.g., 1,2,3)'
     )
+    update_parser.add_argument(
+        '--parallel',
+        action='store_true',
+        help='Download and extract modes concurrently'
+    )
 
     # Status command
     parser.add_argument(
@@ -6,6 +6,7 @@ Provides shared resources like GTFS parser, stop index, and journey planner.
 
 import os
 import logging
+import threading
 from functools import lru_cache
 from typing import Optional
 
@@ -18,6 +19,7 @@ from ..routing.transfer_journey_planner import TransferJourneyPlanner
 from ..realtime.feed_fetcher import GTFSRealtimeFetcher
 from ..realtime.integration import RealtimeIntegrator
 from ..utils.logging_config import get_logger
+from ..utils.gtfs_cache import load_cached
 
 logger = get_logger(__name__)
 
@@ -35,7 +37,12 @@ class TransitService:
     This class is instantiated once and reused across all requests.
     """
 
-    def __init__(self, gtfs_dir: Optional[str] = None, modes_to_load: Optional[list] = None):
+    def __init__(
+        self,
+        gtfs_dir: Optional[str] = None,
+        modes_to_load: Optional[list] = None,
+        cache_dir: Optional[str] = None
+    ):
         """
         Initialize transit service.
 
@@ -43,14 +50,18 @@ class TransitService:
             gtfs_dir: Path to GTFS data directory. Defaults to data/gtfs.
             modes_to_load: List of mode folders to load (e.g., ['1', '2', '3']).
                           Defaults to ['1', '2', '3'] for trains and trams.
+            cache_dir: Directory for the on-disk cache of the built parser,
+                      index and planner. None disables caching.
         """
         self.gtfs_dir = gtfs_dir or DEFAULT_GTFS_DIR
         self.modes_to_load = modes_to_load or ['1', '2', '3']  # V/Line, Metro, Trams by default
+        self.cache_dir = cache_dir
         self._parser: Optional[MultiModalGTFSParser] = None
         self._stop_index: Optional[StopIndex] = None
         self._graph: Optional[TransitGraph] = None
         self._planner: Optional[TransferJourneyPlanner] = None
         self._realtime_fetcher: Optional[GTFSRealtimeFetcher] = None
+        self._realtime_integrator: Optional[RealtimeIntegrator] = None
         self._is_loaded = False
 
     def load(self) -> "TransitService":
@@ -67,22 +78,23 @@ class TransitService:
         logger.info(f"Loading transit data from {self.gtfs_dir} (modes: {self.modes_to_load})")
 
         try:
-            # Load GTFS data using MultiModalGTFSParser
-            self._parser = MultiModalGTFSParser(
-                base_gtfs_dir=self.gtfs_dir,
-                modes_to_load=self.modes_to_load
-            )
-            self._parser.load_all()
-
-            # Build indexes and graph
-            self._stop_index = StopIndex(self._parser)
-            self._graph = TransitGraph(self._parser)
-            self._planner = TransferJourneyPlanner(self._parser)
+            if self.cache_dir:
+                # Reuse the built objects when the GTFS files are unchanged
+                built = load_cached(
+                    self.gtfs_dir,
+                    self._build,
+                    name=f"service-{'-'.join(self.modes_to_load)}",
+                    cache_dir=self.cache_dir
+                )
+            else:
+                built = self._build()
+            self._parser, self._stop_index, self._graph, self._planner = built
 
             # Initialize realtime fetcher (optional - requires API key)
             api_key = os.environ.get("PTV_API_KEY")
             if api_key:
                 self._realtime_fetcher = GTFSRealtimeFetcher(api_key)
+                self._realtime_integrator = RealtimeIntegrator(self._realtime_fetcher)
                 logger.info("Realtime fetcher initialized with API key")
             else:
                 logger.warning("PTV_API_KEY not set - realtime features disabled")
@@ -99,6 +111,27 @@ class TransitService:
 
         return self
 
+    def _build(self) -> tuple:
+        """
+        Parse GTFS data and build the index, graph and planner.
+
+        Returns:
+            Tuple of (parser, stop_index, graph, planner)
+        """
+        # Load GTFS data using MultiModalGTFSParser
+        parser = MultiModalGTFSParser(
+            base_gtfs_dir=self.gtfs_dir,
+            modes_to_load=self.modes_to_load
+        )
+        parser.load_all()
+
+        # Build indexes and graph
+        stop_index = StopIndex(parser)
+        graph = TransitGraph(parser)
+        planner = TransferJourneyPlanner(parser)
+
+        return parser, stop_index, graph, planner
+
     @property
     def is_loaded(self) -> bool:
         """Check if transit data is loaded."""
@@ -140,18 +173,17 @@ class TransitService:
 
     def get_realtime_integrator(self) -> Optional[RealtimeIntegrator]:
         """
-        Get a new realtime integrator instance.
+        Get the shared realtime integrator instance.
 
         Returns:
             RealtimeIntegrator if API key is available, None otherwise.
         """
-        if self._realtime_fetcher and self._parser:
-            return RealtimeIntegrator(self._realtime_fetcher, self._parser)
-        return None
+        return self._realtime_integrator
 
 
 # Global transit service instance
 _transit_service: Optional[TransitService] = None
+_transit_service_lock = threading.Lock()
 
 
 def get_transit_service() -> TransitService:
@@ -165,16 +197,31 @@ def get_transit_service() -> TransitService:
     """
     global _transit_service
 
-    if _transit_service is None:
+    # Fast path once loaded: no lock on every request
+    service = _transit_service
+    if service is not None:
+        return service
+
+    # Double-checked so concurrent first requests don't load GTFS twice
+    with _transit_service_lock:
+        if _transit_service is not None:
+            return _transit_service
+
         # Get modes to load from environment variable or use default
         modes_env = os.environ.get('GTFS_MODES_TO_LOAD', '1,2,3')
         modes_to_load = [m.strip() for m in modes_env.split(',')]
 
+        # On-disk cache of the built service; set GTFS_CACHE_DIR="" to disable
+        cache_dir = os.environ.get('GTFS_CACHE_DIR', os.path.join(DEFAULT_GTFS_DIR, '.cache'))
+
         logger.info(f"Initializing transit service with modes: {modes_to_load}")
-        _transit_service = TransitService(modes_to_load=modes_to_load)
-        _transit_service.load()
+        service = TransitService(modes_to_load=modes_to_load, cache_dir=cache_dir or None)
+        service.load()
+
+        # Publish only once fully loaded so the fast path never sees a partial service
+        _transit_service = service
 
-    return _transit_service
+    return service
 
 
 def reset_transit_service() -> None:
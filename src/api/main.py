@@ -4,9 +4,14 @@ PTV Transit Assistant API - Main Application.
 FastAPI application for journey planning with Melbourne's public transport.
 """
 
+import os
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from pathlib import Path
+
+import orjson
+from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.openapi.utils import get_openapi
 
 from .routes import journey_router, stops_router, health_router, vehicles_router, alerts_router
@@ -63,7 +68,7 @@ async def lifespan(app: FastAPI):
     # Pre-load transit data
     try:
         service = get_transit_service()
-        logger.info(f"Transit data loaded: {service.parser.stops if service.parser else 0} stops")
+        logger.info(f"Transit data loaded: {len(service.parser.stops) if service.parser else 0} stops")
     except Exception as e:
         logger.error(f"Failed to load transit data: {e}")
 
@@ -128,25 +133,37 @@ app = FastAPI(
         "name": "MIT License",
         "url": "https://opensource.org/licenses/MIT",
     },
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
-# Add CORS middleware
+# Add CORS middleware. Origins come from CORS_ORIGINS (comma-separated);
+# the default "*" is only valid without credentials, so they are enabled
+# just for an explicit allowlist.
+CORS_ORIGINS = frozenset(
+    origin.strip() for origin in os.environ.get("CORS_ORIGINS", "*").split(",") if origin.strip()
+)
+_cors_wildcard = CORS_ORIGINS == {"*"}
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=["*"] if _cors_wildcard else sorted(CORS_ORIGINS),
+    allow_credentials=not _cors_wildcard,
+    allow_methods=["GET", "POST"],
+    allow_headers=["authorization", "content-type"],
 )
 
-# Include routers
-app.include_router(health_router, prefix="/api/v1")
-app.include_router(stops_router, prefix="/api/v1")
-app.include_router(journey_router, prefix="/api/v1")
-app.include_router(vehicles_router, prefix="/api/v1")
-app.include_router(alerts_router, prefix="/api/v1")
-app.include_router(admin_router, prefix="/api/v1")  # Admin endpoints
+# Include routers under a single versioned router
+api_v1 = APIRouter(prefix="/api/v1")
+for router in (
+    health_router,
+    stops_router,
+    journey_router,
+    vehicles_router,
+    alerts_router,
+    admin_router,  # Admin endpoints
+):
+    api_v1.include_router(router)
+app.include_router(api_v1)
 
 
 @app.get("/", tags=["root"])
@@ -160,7 +177,48 @@ def root():
     }
 
 
+def custom_openapi() -> dict:
+    """
+    Return the OpenAPI schema, loading a prebuilt copy when configured.
+
+    If OPENAPI_SCHEMA_PATH points to a file written by
+    scripts/build_openapi.py, it is loaded instead of walking every route
+    and model on the first /openapi.json request. Otherwise the schema is
+    generated by FastAPI's default. Either way it is cached on the app.
+    """
+    if app.openapi_schema:
+        return app.openapi_schema
+
+    schema_path = os.environ.get("OPENAPI_SCHEMA_PATH")
+    if schema_path:
+        try:
+            app.openapi_schema = orjson.loads(Path(schema_path).read_bytes())
+            return app.openapi_schema
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"Could not load OpenAPI schema from {schema_path}: {e}")
+
+    return FastAPI.openapi(app)
+
+
+app.openapi = custom_openapi
+
+
 # For running with uvicorn directly
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+
+    # Each worker is a separate process with its own TransitService, so
+    # memory and startup time scale with API_WORKERS (the GTFS pickle
+    # cache keeps the extra loads cheap). Multiple workers need an
+    # import string rather than the app object.
+    workers = int(os.environ.get("API_WORKERS", "1"))
+    uvicorn.run(
+        "src.api.main:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=8000,
+        workers=workers,
+        # C event loop and HTTP parser; uvloop has no Windows support
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
+    )
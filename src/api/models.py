@@ -5,10 +5,15 @@ These models define the schema for API endpoints with comprehensive
 examples for OpenAPI documentation.
 """
 
-from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Optional, Union
+import re
+
+from pydantic import BaseModel, Field, ConfigDict, field_validator
+from typing import List, Optional
 from datetime import datetime
 
+# HH:MM:SS, 24-hour. Compiled once and shared by every request.
+_TIME_RE = re.compile(r"([01]\d|2[0-3]):[0-5]\d:[0-5]\d")
+
 
 # ============== Request Models ==============
 
@@ -62,6 +67,14 @@ class JourneyPlanRequest(BaseModel):
         description="Maximum number of transfers (connections) allowed in the journey. Set to 0 for direct services only."
     )
 
+    @field_validator("departure_time")
+    @classmethod
+    def _check_departure_time(cls, value: str) -> str:
+        """Reject departure times that are not HH:MM:SS."""
+        if not _TIME_RE.fullmatch(value):
+            raise ValueError("departure_time must be in HH:MM:SS format (24-hour)")
+        return value
+
 
 class StopSearchRequest(BaseModel):
     """Request model for stop search."""
@@ -120,13 +133,21 @@ class StopResponse(BaseModel):
 
     stop_id: str = Field(..., description="Unique stop identifier from GTFS data")
     stop_name: str = Field(..., description="Human-readable stop name")
-    stop_lat: Optional[Union[str, float]] = Field(None, description="Latitude coordinate (WGS84)")
-    stop_lon: Optional[Union[str, float]] = Field(None, description="Longitude coordinate (WGS84)")
+    stop_lat: Optional[float] = Field(None, description="Latitude coordinate (WGS84)")
+    stop_lon: Optional[float] = Field(None, description="Longitude coordinate (WGS84)")
     match_score: Optional[int] = Field(
         None,
         description="Fuzzy match score (0-100). Only present in search results. 100 = exact match."
     )
 
+    @field_validator("stop_lat", "stop_lon", mode="before")
+    @classmethod
+    def _blank_coordinate_to_none(cls, value):
+        """Treat blank GTFS coordinates as missing; numeric strings coerce to float."""
+        if isinstance(value, str) and not value.strip():
+            return None
+        return value
+
 
 class LegResponse(BaseModel):
     """Response model for a journey leg (single trip segment)."""
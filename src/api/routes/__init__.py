@@ -1,11 +1,28 @@
 """
 API route modules.
+
+Routers are imported on first access (PEP 562), so importing one route
+module (e.g. ``from src.api.routes import alerts``) does not load the
+others and their models.
 """
 
-from .journey import router as journey_router
-from .stops import router as stops_router
-from .health import router as health_router
-from .vehicles import router as vehicles_router
-from .alerts import router as alerts_router
+import importlib
+
+_ROUTER_MODULES = {
+    "journey_router": "journey",
+    "stops_router": "stops",
+    "health_router": "health",
+    "vehicles_router": "vehicles",
+    "alerts_router": "alerts",
+}
 
 __all__ = ["journey_router", "stops_router", "health_router", "vehicles_router", "alerts_router"]
+
+
+def __getattr__(name):
+    module_name = _ROUTER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    router = importlib.import_module(f".{module_name}", __name__).router
+    globals()[name] = router
+    return router
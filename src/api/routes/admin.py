@@ -5,22 +5,42 @@ Provides administrative endpoints for GTFS data management and service control.
 Requires admin API key for authentication.
 """
 
+import hmac
 import os
-from typing import Dict, Any, Optional
-from fastapi import APIRouter, Header, HTTPException, Depends
+from typing import Dict, Any, Literal, Optional
+import orjson
+from fastapi import APIRouter, Header, HTTPException, Depends, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 
 from ...data.gtfs_scheduler import get_gtfs_scheduler, initialize_gtfs_scheduler
 from ...data.service_manager import get_service_manager
 from ...api.dependencies import reset_transit_service
+from ...utils.cache import TTLCache
 
-router = APIRouter(prefix="/admin", tags=["admin"])
+# Handlers return responses directly and routes declare no response_model,
+# so FastAPI never re-validates output or runs jsonable_encoder over nested
+# results; the models are documented via `responses` instead. Response
+# models are built with model_construct() because their fields come from
+# the trusted scheduler and service manager, not from the client.
+router = APIRouter(prefix="/admin", tags=["admin"], default_response_class=ORJSONResponse)
+
+# Serialized /gtfs/status bodies keyed by last update time. Status only
+# changes on update cycles, so dashboards polling it reuse the bytes for
+# a few seconds instead of re-reading version files on every request.
+STATUS_CACHE_TTL = 5.0
+_status_cache: TTLCache[bytes] = TTLCache(default_ttl=STATUS_CACHE_TTL, max_size=4)
+
+
+# PTV GTFS mode folders (1-6, 10, 11)
+ModeCode = Literal["1", "2", "3", "4", "5", "6", "10", "11"]
 
 
 # Request/Response Models
 class UpdateRequest(BaseModel):
     """Request model for manual GTFS update."""
-    modes: Optional[list[str]] = None
+    modes: Optional[list[ModeCode]] = None
     """List of modes to update (e.g., ["1", "2", "3"]). If None, updates all configured modes."""
 
 
@@ -40,7 +60,7 @@ class StatusResponse(BaseModel):
     """ISO timestamp of next scheduled update or None."""
     auto_update_enabled: bool
     update_interval: str
-    modes_to_update: list[str]
+    modes_to_update: tuple[str, ...]
     rate_limit_delay: float
     """Delay in seconds between downloads to respect rate limits."""
     max_retries: int
@@ -54,6 +74,14 @@ class ReloadResponse(BaseModel):
     message: str
 
 
+class HistoryResponse(BaseModel):
+    """Response model for update history (documentation only; streamed as JSON)."""
+    total: int
+    limit: int
+    history: list[Dict[str, Any]]
+    """Update attempts as recorded by the scheduler, most recent first."""
+
+
 # Helper function to verify admin API key
 def verify_admin_key(authorization: str = Header(..., description="Admin API key")):
     """
@@ -74,22 +102,21 @@ def verify_admin_key(authorization: str = Header(..., description="Admin API key
         )
 
     # Support both "Bearer <key>" and direct key formats
-    provided_key = authorization
-    if authorization.startswith("Bearer "):
-        provided_key = authorization[7:]
+    provided_key = authorization.removeprefix("Bearer ")
 
-    if provided_key != admin_key:
+    # Constant-time comparison so response timing doesn't leak the key
+    if not hmac.compare_digest(provided_key.encode(), admin_key.encode()):
         raise HTTPException(
             status_code=401,
             detail="Invalid admin API key"
         )
 
 
-@router.post("/gtfs/update", response_model=UpdateResponse)
+@router.post("/gtfs/update", response_model=None, responses={200: {"model": UpdateResponse}})
 async def trigger_gtfs_update(
     request: UpdateRequest,
     _: str = Depends(verify_admin_key)
-) -> UpdateResponse:
+) -> ORJSONResponse:
     """
     Manually trigger GTFS data update.
 
@@ -121,8 +148,12 @@ async def trigger_gtfs_update(
         if scheduler is None:
             scheduler = initialize_gtfs_scheduler()
 
-        # Run update
-        result = scheduler.run_update_now(modes=request.modes, retry_on_failure=True)
+        # Run update in a worker thread; downloads take minutes and would
+        # otherwise block the event loop (and every other request)
+        result = await run_in_threadpool(
+            scheduler.run_update_now, modes=request.modes, retry_on_failure=True
+        )
+        _status_cache.clear()
 
         # Check overall success
         success = any(r['success'] for r in result.values())
@@ -134,11 +165,11 @@ async def trigger_gtfs_update(
         else:
             message = "All updates failed"
 
-        return UpdateResponse(
+        return ORJSONResponse(UpdateResponse.model_construct(
             success=success,
             message=message,
             results=result
-        )
+        ).model_dump())
 
     except Exception as e:
         raise HTTPException(
@@ -147,10 +178,10 @@ async def trigger_gtfs_update(
         )
 
 
-@router.get("/gtfs/status", response_model=StatusResponse)
+@router.get("/gtfs/status", response_model=None, responses={200: {"model": StatusResponse}})
 async def get_gtfs_status(
     _: str = Depends(verify_admin_key)
-) -> StatusResponse:
+) -> Response:
     """
     Get GTFS update status and configuration.
 
@@ -174,25 +205,32 @@ async def get_gtfs_status(
         if scheduler is None:
             scheduler = initialize_gtfs_scheduler()
 
-        service_manager = get_service_manager()
-
         # Get timestamps
         last_update = scheduler.get_last_update_time()
+
+        cache_key = last_update.isoformat() if last_update else ""
+        body = _status_cache.get(cache_key)
+        if body is not None:
+            return Response(content=body, media_type="application/json")
+
+        service_manager = get_service_manager()
         next_update = scheduler.get_next_update_time()
 
         # Get data versions
         data_versions = service_manager.get_data_version()
 
-        return StatusResponse(
+        body = orjson.dumps(StatusResponse.model_construct(
             last_update=last_update.isoformat() if last_update else None,
             next_update=next_update.isoformat() if next_update else None,
             auto_update_enabled=scheduler.auto_update_enabled,
             update_interval=scheduler.update_interval,
-            modes_to_update=scheduler.modes_to_update,
+            modes_to_update=tuple(scheduler.modes_to_update),
             rate_limit_delay=scheduler.rate_limit_delay,
             max_retries=scheduler.max_retries,
             data_versions=data_versions
-        )
+        ).model_dump())
+        _status_cache.set(cache_key, body)
+        return Response(content=body, media_type="application/json")
 
     except Exception as e:
         raise HTTPException(
@@ -201,11 +239,26 @@ async def get_gtfs_status(
         )
 
 
-@router.get("/gtfs/history")
+def _stream_history(history: list, limit: int):
+    """
+    Yield the history response as JSON chunks, one entry at a time.
+
+    Produces the same document as {"total", "limit", "history"} without
+    building the whole payload in memory before sending it.
+    """
+    yield b'{"total":%d,"limit":%d,"history":[' % (len(history), limit)
+    for i, entry in enumerate(history):
+        if i:
+            yield b","
+        yield orjson.dumps(entry, default=str)
+    yield b"]}"
+
+
+@router.get("/gtfs/history", response_model=None, responses={200: {"model": HistoryResponse}})
 async def get_gtfs_history(
     limit: int = 10,
     _: str = Depends(verify_admin_key)
-) -> Dict[str, Any]:
+) -> StreamingResponse:
     """
     Get GTFS update history.
 
@@ -233,11 +286,10 @@ async def get_gtfs_history(
 
         history = scheduler.get_update_history(limit=limit)
 
-        return {
-            "total": len(history),
-            "limit": limit,
-            "history": history
-        }
+        return StreamingResponse(
+            _stream_history(history, limit),
+            media_type="application/json"
+        )
 
     except Exception as e:
         raise HTTPException(
@@ -246,10 +298,10 @@ async def get_gtfs_history(
         )
 
 
-@router.post("/reload", response_model=ReloadResponse)
+@router.post("/reload", response_model=None, responses={200: {"model": ReloadResponse}})
 async def reload_services(
     _: str = Depends(verify_admin_key)
-) -> ReloadResponse:
+) -> ORJSONResponse:
     """
     Reload transit services without downloading new data.
 
@@ -269,12 +321,13 @@ async def reload_services(
     """
     try:
         service_manager = get_service_manager()
-        success, message = service_manager.reload_all_services()
+        success, message = await run_in_threadpool(service_manager.reload_all_services)
+        _status_cache.clear()
 
-        return ReloadResponse(
+        return ORJSONResponse(ReloadResponse.model_construct(
             success=success,
             message=message
-        )
+        ).model_dump())
 
     except Exception as e:
         raise HTTPException(
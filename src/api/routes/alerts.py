@@ -5,8 +5,10 @@ Provides service alert information from GTFS Realtime feeds.
 Supports metro and tram modes (PTV limitation: bus/vline have no alerts feed).
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import List, Optional, Dict, Any
+import hashlib
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from typing import List, Optional, Dict, Any, Tuple
 
 from ..dependencies import get_transit_service, TransitService
 from ...utils.logging_config import get_logger
@@ -19,6 +21,10 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/alerts", tags=["alerts"])
 
+# Client cache lifetime for alert lists (seconds); PTV feeds refresh about
+# every 30 seconds
+ALERTS_MAX_AGE = 20
+
 
 # ============== Response Models ==============
 
@@ -155,8 +161,29 @@ class AlertSummaryResponse(BaseModel):
 
 # ============== Helper Functions ==============
 
+# Converted responses by alert_id, stored with the alert they were built
+# from. Feeds only change every few tens of seconds, so most requests
+# re-serve the same alerts; a hit requires the new alert to compare equal
+# (dataclass field-by-field) to the cached one, so edited alerts rebuild.
+_ALERT_RESPONSE_CACHE_SIZE = 512
+_alert_response_cache: Dict[str, Tuple[ServiceAlertModel, ServiceAlertResponse]] = {}
+
+
 def _alert_to_response(alert: ServiceAlertModel) -> ServiceAlertResponse:
-    """Convert internal ServiceAlert to API response model."""
+    """Convert internal ServiceAlert to API response model, reusing unchanged ones."""
+    cached = _alert_response_cache.get(alert.alert_id)
+    if cached is not None and cached[0] == alert:
+        return cached[1]
+
+    response = _build_alert_response(alert)
+    if len(_alert_response_cache) >= _ALERT_RESPONSE_CACHE_SIZE:
+        _alert_response_cache.clear()
+    _alert_response_cache[alert.alert_id] = (alert, response)
+    return response
+
+
+def _build_alert_response(alert: ServiceAlertModel) -> ServiceAlertResponse:
+    """Build the API response model for an internal ServiceAlert."""
     active_periods = [
         ActivePeriodResponse(start=p.start, end=p.end)
         for p in alert.active_periods
@@ -191,22 +218,62 @@ def _alert_to_response(alert: ServiceAlertModel) -> ServiceAlertResponse:
     )
 
 
+def _json_response(if_none_match: Optional[str], model: BaseModel) -> Response:
+    """
+    Serialize a response model in one pass with pydantic-core.
+
+    Returning the model itself would make FastAPI dump it, re-validate it
+    against a response_model and run jsonable_encoder over every alert;
+    list endpoints therefore document their model via ``responses``.
+
+    Alerts only change when the feed refreshes, so responses carry an
+    ETag and a short max-age; a client whose If-None-Match matches gets
+    an empty 304 instead of the body.
+    """
+    body = model.model_dump_json().encode()
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={ALERTS_MAX_AGE}"}
+
+    # Handlers are also called as plain functions (app.py's embedded
+    # backend), where an omitted Header() default is a FieldInfo, not None
+    if isinstance(if_none_match, str) and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header value (possibly a list, or weak tags) against an ETag."""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+# Parser shared across requests so its parsed-alert cache persists
+_parser: Optional[ServiceAlertParser] = None
+
+
 def _get_parser(service: TransitService) -> ServiceAlertParser:
-    """Get or create a ServiceAlertParser instance."""
+    """Get the shared ServiceAlertParser, recreating it if the fetcher changed."""
+    global _parser
     fetcher = service.get_realtime_fetcher()
     if not fetcher:
         raise HTTPException(
             status_code=503,
             detail="Realtime data not available. PTV API key may not be configured."
         )
-    return ServiceAlertParser(fetcher=fetcher)
+    parser = _parser
+    if parser is None or parser.fetcher is not fetcher:
+        parser = _parser = ServiceAlertParser(fetcher=fetcher)
+    return parser
 
 
 # ============== Endpoints ==============
 
 @router.get(
     "",
-    response_model=AlertListResponse,
+    response_model=None,
     summary="Get All Service Alerts",
     description="""Fetch all service alerts for a transport mode.
 
@@ -217,6 +284,7 @@ Alerts include disruptions, delays, track works, and service changes.
 Use `active_only=true` (default) to filter out expired alerts.""",
     responses={
         200: {
+            "model": AlertListResponse,
             "description": "List of service alerts",
             "content": {
                 "application/json": {
@@ -252,8 +320,9 @@ def get_all_alerts(
         default=True,
         description="Only return currently active alerts (recommended)"
     ),
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match", include_in_schema=False),
     service: TransitService = Depends(get_transit_service)
-) -> AlertListResponse:
+) -> Response:
     """
     Get all service alerts for a transport mode.
 
@@ -276,13 +345,13 @@ def get_all_alerts(
 
         alert_responses = [_alert_to_response(a) for a in alerts]
 
-        return AlertListResponse(
+        return _json_response(if_none_match, AlertListResponse(
             success=True,
             message=f"Found {len(alert_responses)} {'active ' if active_only else ''}alerts",
             mode=mode,
             count=len(alert_responses),
             alerts=alert_responses
-        )
+        ))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -404,14 +473,14 @@ def get_alert_by_id(
 
 @router.get(
     "/route/{route_id}",
-    response_model=AlertListResponse,
+    response_model=None,
     summary="Get Alerts for Route",
     description="""Get all service alerts affecting a specific route.
 
 Filters alerts to only those that mention the given route ID in their
 informed entities. Useful for showing disruptions on a specific line.""",
     responses={
-        200: {"description": "List of alerts affecting the route"},
+        200: {"model": AlertListResponse, "description": "List of alerts affecting the route"},
         503: {"description": "Realtime data unavailable"}
     }
 )
@@ -427,8 +496,9 @@ def get_alerts_for_route(
         default=True,
         description="Only return currently active alerts"
     ),
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match", include_in_schema=False),
     service: TransitService = Depends(get_transit_service)
-) -> AlertListResponse:
+) -> Response:
     """
     Get alerts affecting a specific route.
 
@@ -445,21 +515,21 @@ def get_alerts_for_route(
 
     try:
         parser = _get_parser(service)
-        alerts = parser.fetch_alerts(mode=mode)
-        route_alerts = parser.get_alerts_for_route(route_id, alerts)
+        parser.fetch_alerts(mode=mode)
+        route_alerts = parser.lookup_alerts(mode, 'route', route_id)
 
         if active_only:
             route_alerts = parser.get_active_alerts(route_alerts)
 
         alert_responses = [_alert_to_response(a) for a in route_alerts]
 
-        return AlertListResponse(
+        return _json_response(if_none_match, AlertListResponse(
             success=True,
             message=f"Found {len(alert_responses)} alerts for route {route_id}",
             mode=mode,
             count=len(alert_responses),
             alerts=alert_responses
-        )
+        ))
     except Exception as e:
         logger.error(f"Failed to fetch alerts for route {route_id}: {e}")
         raise HTTPException(status_code=503, detail=f"Failed to fetch alert data: {e}")
@@ -467,14 +537,14 @@ def get_alerts_for_route(
 
 @router.get(
     "/stop/{stop_id}",
-    response_model=AlertListResponse,
+    response_model=None,
     summary="Get Alerts for Stop",
     description="""Get all service alerts affecting a specific stop.
 
 Filters alerts to only those that mention the given stop ID in their
 informed entities. Useful for station-specific disruption displays.""",
     responses={
-        200: {"description": "List of alerts affecting the stop"},
+        200: {"model": AlertListResponse, "description": "List of alerts affecting the stop"},
         503: {"description": "Realtime data unavailable"}
     }
 )
@@ -490,8 +560,9 @@ def get_alerts_for_stop(
         default=True,
         description="Only return currently active alerts"
     ),
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match", include_in_schema=False),
     service: TransitService = Depends(get_transit_service)
-) -> AlertListResponse:
+) -> Response:
     """
     Get alerts affecting a specific stop.
 
@@ -508,21 +579,21 @@ def get_alerts_for_stop(
 
     try:
         parser = _get_parser(service)
-        alerts = parser.fetch_alerts(mode=mode)
-        stop_alerts = parser.get_alerts_for_stop(stop_id, alerts)
+        parser.fetch_alerts(mode=mode)
+        stop_alerts = parser.lookup_alerts(mode, 'stop', stop_id)
 
         if active_only:
             stop_alerts = parser.get_active_alerts(stop_alerts)
 
         alert_responses = [_alert_to_response(a) for a in stop_alerts]
 
-        return AlertListResponse(
+        return _json_response(if_none_match, AlertListResponse(
             success=True,
             message=f"Found {len(alert_responses)} alerts for stop {stop_id}",
             mode=mode,
             count=len(alert_responses),
             alerts=alert_responses
-        )
+        ))
     except Exception as e:
         logger.error(f"Failed to fetch alerts for stop {stop_id}: {e}")
         raise HTTPException(status_code=503, detail=f"Failed to fetch alert data: {e}")
@@ -530,7 +601,7 @@ def get_alerts_for_stop(
 
 @router.get(
     "/severity/{severity}",
-    response_model=AlertListResponse,
+    response_model=None,
     summary="Get Alerts by Severity",
     description="""Get all service alerts of a specific severity level.
 
@@ -539,7 +610,7 @@ def get_alerts_for_stop(
 - `WARNING` - Significant disruptions, delays
 - `SEVERE` - Major disruptions, service cancellations""",
     responses={
-        200: {"description": "List of alerts matching the severity"},
+        200: {"model": AlertListResponse, "description": "List of alerts matching the severity"},
         400: {"description": "Invalid severity level"},
         503: {"description": "Realtime data unavailable"}
     }
@@ -552,8 +623,9 @@ def get_alerts_by_severity(
         pattern="^(metro|vline|tram|bus)$",
         examples=["metro", "tram"]
     ),
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match", include_in_schema=False),
     service: TransitService = Depends(get_transit_service)
-) -> AlertListResponse:
+) -> Response:
     """
     Get alerts by severity level.
 
@@ -579,18 +651,18 @@ def get_alerts_by_severity(
 
     try:
         parser = _get_parser(service)
-        alerts = parser.fetch_alerts(mode=mode)
-        severity_alerts = parser.get_alerts_by_severity(sev, alerts)
+        parser.fetch_alerts(mode=mode)
+        severity_alerts = parser.lookup_alerts(mode, 'severity', sev)
 
         alert_responses = [_alert_to_response(a) for a in severity_alerts]
 
-        return AlertListResponse(
+        return _json_response(if_none_match, AlertListResponse(
             success=True,
             message=f"Found {len(alert_responses)} {severity} alerts",
             mode=mode,
             count=len(alert_responses),
             alerts=alert_responses
-        )
+        ))
     except HTTPException:
         raise
     except Exception as e:
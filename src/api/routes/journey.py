@@ -5,7 +5,9 @@ Provides journey planning functionality with optional realtime integration.
 Supports multi-leg journeys with transfer handling.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Body
+from typing import Union
+
+from fastapi import APIRouter, Depends, HTTPException, Body, Response
 
 from ..models import (
     JourneyPlanRequest,
@@ -59,6 +61,10 @@ def _journey_to_response(journey) -> JourneyResponse:
     """
     Convert internal Journey object to JourneyResponse.
 
+    The planner's Journey/Leg dataclasses already hold correctly typed
+    values, so the response models are built with model_construct()
+    rather than re-validating every field of every leg.
+
     Args:
         journey: Internal Journey object
 
@@ -67,7 +73,7 @@ def _journey_to_response(journey) -> JourneyResponse:
     """
     legs = []
     for leg in journey.legs:
-        leg_response = LegResponse(
+        leg_response = LegResponse.model_construct(
             from_stop_id=leg.from_stop_id,
             from_stop_name=leg.from_stop_name,
             to_stop_id=leg.to_stop_id,
@@ -102,7 +108,7 @@ def _journey_to_response(journey) -> JourneyResponse:
     has_realtime = any(leg.has_realtime_data for leg in journey.legs)
     total_delay = sum(leg.arrival_delay_seconds for leg in journey.legs if leg.has_realtime_data)
 
-    return JourneyResponse(
+    return JourneyResponse.model_construct(
         origin_stop_id=journey.origin_stop_id,
         origin_stop_name=journey.origin_stop_name,
         destination_stop_id=journey.destination_stop_id,
@@ -199,7 +205,7 @@ def plan_journey(
         ]
     ),
     service: TransitService = Depends(get_transit_service)
-) -> JourneyPlanResponse:
+) -> Union[JourneyPlanResponse, Response]:
     """
     Plan a journey between two stops.
 
@@ -270,8 +276,16 @@ def plan_journey(
         f"{journey_response.duration_minutes} min, {journey_response.num_transfers} transfer(s)"
     )
 
-    return JourneyPlanResponse(
+    result = JourneyPlanResponse.model_construct(
         success=True,
         message="Journey found",
         journey=journey_response
     )
+
+    # Serialize directly; returning the model would make FastAPI dump and
+    # re-validate the whole journey against response_model. Unset optional
+    # fields (mostly realtime ones) are omitted rather than sent as null.
+    return Response(
+        content=result.model_dump_json(exclude_none=True),
+        media_type="application/json"
+    )
@@ -4,7 +4,7 @@ Stops search endpoint.
 Provides stop lookup and search functionality with fuzzy matching support.
 """
 
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Response
 
 from ..models import StopSearchResponse, StopResponse, ErrorResponse
 from ..dependencies import get_transit_service, TransitService
@@ -73,7 +73,7 @@ def search_stops(
         description="Use fuzzy matching to handle typos and partial names"
     ),
     service: TransitService = Depends(get_transit_service)
-) -> StopSearchResponse:
+) -> Response:
     """
     Search for stops by name.
 
@@ -119,7 +119,7 @@ def search_stops(
 
     logger.info(f"Stop search for '{query}' returned {len(stops)} results")
 
-    return StopSearchResponse(
+    result = StopSearchResponse(
         success=True,
         message=f"Found {len(stops)} stop(s) matching '{query}'",
         query=query,
@@ -127,6 +127,10 @@ def search_stops(
         stops=stops
     )
 
+    # Serialize with the model's compiled pydantic-core serializer in one
+    # pass, skipping FastAPI's response re-validation and jsonable_encoder
+    return Response(content=result.model_dump_json(), media_type="application/json")
+
 
 @router.get(
     "/{stop_id}",
@@ -153,7 +153,7 @@ class TransitCLI:
             if api_key:
                 try:
                     fetcher = GTFSRealtimeFetcher(api_key)
-                    integrator = RealtimeIntegrator(fetcher, self.parser)
+                    integrator = RealtimeIntegrator(fetcher)
                     journey = integrator.apply_realtime_to_journey(journey)
                     print("(Realtime data applied)")
                 except Exception as e:
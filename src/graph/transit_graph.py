@@ -8,15 +8,24 @@ same trip with travel time weights.
 
 from typing import Dict, List, Optional, Tuple, Set
 from dataclasses import dataclass
+from itertools import chain
 import logging
 import networkx as nx
+import numpy as np
 from datetime import datetime, timedelta
+import sys
 
 from ..data.models import Stop, Trip, StopTime
 from ..data.gtfs_parser import GTFSParser
 
 logger = logging.getLogger(__name__)
 
+# Connection fields whose string values are interned
+_INTERNED_FIELDS = (
+    'from_stop_id', 'to_stop_id', 'trip_id', 'route_id', 'service_id',
+    'departure_time', 'arrival_time'
+)
+
 
 @dataclass
 class Connection:
@@ -35,6 +44,12 @@ class Connection:
     def __post_init__(self):
         """Validate and convert types."""
         self.travel_time_seconds = int(self.travel_time_seconds)
+        # IDs and times repeat across thousands of connections; interning
+        # keeps one copy of each and lets dict lookups match by identity
+        for field in _INTERNED_FIELDS:
+            value = getattr(self, field)
+            if type(value) is str:
+                setattr(self, field, sys.intern(value))
         if self.route_type is not None:
             self.route_type = int(self.route_type)
 
@@ -75,12 +90,21 @@ class TransitGraph:
         """
         self.graph = nx.DiGraph()
         self.parser = gtfs_parser
-        self.connections: List[Connection] = []
+        self.regular_connections: List[Connection] = []  # Timetabled trip connections
+        self.transfer_connections: List[Connection] = []  # Walking/interchange transfers
         self._sorted_connections: Optional[List[Connection]] = None  # Cached sorted connections
+        self._first_transfer_index: Optional[int] = None  # Boundary between regular and transfer connections
+        self._sorted_departure_seconds: Optional[np.ndarray] = None  # Column parallel to _sorted_connections
+        self._sorted_arrival_seconds: Optional[np.ndarray] = None  # Column parallel to _sorted_connections
 
         if gtfs_parser:
             self.build_from_parser(gtfs_parser)
 
+    @property
+    def connections(self) -> List[Connection]:
+        """All connections: regular connections followed by transfers."""
+        return self.regular_connections + self.transfer_connections
+
     def build_from_parser(self, parser: GTFSParser) -> 'TransitGraph':
         """
         Build graph from GTFS parser data.
@@ -112,14 +136,47 @@ class TransitGraph:
         regular timetabled connections. This ensures earliest_arrival times
         are updated by regular connections before transfers are considered.
         """
-        logger.debug(f"Pre-sorting {len(self.connections)} connections by departure time")
-        self._sorted_connections = sorted(
-            self.connections,
-            key=lambda c: (
-                1 if c.is_transfer else 0,  # Transfers last
-                self._time_to_seconds(c.departure_time)  # Then by time
-            )
+        logger.debug(
+            f"Pre-sorting {len(self.regular_connections) + len(self.transfer_connections)} "
+            f"connections by departure time"
         )
+        # Parse each time string once into int32 columns; the same columns
+        # drive the (stable) sort and are kept for planners' window searches
+        sorted_connections = []
+        departures = []
+        arrivals = []
+        for group in (self.regular_connections, self.transfer_connections):
+            dep = self._seconds_array(c.departure_time for c in group)
+            arr = self._seconds_array(c.arrival_time for c in group)
+            order = np.argsort(dep, kind='stable')
+            sorted_connections.extend(group[i] for i in order.tolist())
+            departures.append(dep[order])
+            arrivals.append(arr[order])
+
+        self._sorted_connections = sorted_connections
+        self._first_transfer_index = len(self.regular_connections)
+        self._sorted_departure_seconds = np.concatenate(departures)
+        self._sorted_arrival_seconds = np.concatenate(arrivals)
+
+    def _seconds_array(self, time_strs) -> np.ndarray:
+        """Convert GTFS time strings to an int32 array of seconds since midnight."""
+        return np.fromiter((self._time_to_seconds(t) for t in time_strs), dtype=np.int32)
+
+    def add_connection(self, connection: Connection) -> None:
+        """
+        Add a connection and invalidate the cached sort order.
+
+        Args:
+            connection: Connection to add
+        """
+        if connection.is_transfer:
+            self.transfer_connections.append(connection)
+        else:
+            self.regular_connections.append(connection)
+        self._sorted_connections = None
+        self._first_transfer_index = None
+        self._sorted_departure_seconds = None
+        self._sorted_arrival_seconds = None
 
     def _time_to_seconds(self, time_str: str) -> int:
         """Convert GTFS time string to seconds since midnight."""
@@ -137,6 +194,36 @@ class TransitGraph:
             self._sort_connections()
         return self._sorted_connections
 
+    def get_first_transfer_index(self) -> int:
+        """
+        Get the index of the first transfer in the sorted connections.
+
+        Regular connections occupy ``[:index]`` and transfers ``[index:]``.
+
+        Returns:
+            Index of the first transfer connection (length of the list if none).
+        """
+        if self._sorted_connections is None:
+            self._sort_connections()
+        return self._first_transfer_index
+
+    def get_sorted_times(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get departure and arrival times for the sorted connections.
+
+        Both arrays are parallel to get_sorted_connections(), so
+        ``departures[i]`` is the departure of ``get_sorted_connections()[i]``
+        in seconds since midnight. Within the regular connections
+        (``[:get_first_transfer_index()]``) departures are ascending, so
+        time windows can be located with ``np.searchsorted``.
+
+        Returns:
+            Tuple of (departure_seconds, arrival_seconds) int32 arrays.
+        """
+        if self._sorted_connections is None:
+            self._sort_connections()
+        return self._sorted_departure_seconds, self._sorted_arrival_seconds
+
     def _add_stop_nodes(self):
         """Add all stops as nodes to the graph."""
         if not self.parser:
@@ -195,7 +282,7 @@ class TransitGraph:
                     is_transfer=False,
                     service_id=service_id
                 )
-                self.connections.append(connection)
+                self.add_connection(connection)
 
                 # Add edge to graph (or update with minimum travel time)
                 self._add_or_update_edge(
@@ -368,7 +455,10 @@ class TransitGraph:
         Returns:
             List of Connection objects
         """
-        return [conn for conn in self.connections if conn.from_stop_id == stop_id]
+        return [
+            conn for conn in chain(self.regular_connections, self.transfer_connections)
+            if conn.from_stop_id == stop_id
+        ]
 
     def get_connections_between(self, from_stop_id: str, to_stop_id: str) -> List[Connection]:
         """
@@ -382,7 +472,7 @@ class TransitGraph:
             List of Connection objects
         """
         return [
-            conn for conn in self.connections
+            conn for conn in chain(self.regular_connections, self.transfer_connections)
             if conn.from_stop_id == from_stop_id and conn.to_stop_id == to_stop_id
         ]
 
@@ -396,7 +486,7 @@ class TransitGraph:
         return {
             'num_stops': self.graph.number_of_nodes(),
             'num_connections': self.graph.number_of_edges(),
-            'num_total_connections': len(self.connections),
+            'num_total_connections': len(self.regular_connections) + len(self.transfer_connections),
             'avg_degree': sum(dict(self.graph.degree()).values()) / max(self.graph.number_of_nodes(), 1)
         }
 
@@ -404,6 +494,15 @@ class TransitGraph:
         """Check if stop exists in graph."""
         return self.graph.has_node(stop_id)
 
+    def get_station_id(self, stop_id: str) -> str:
+        """
+        Get the node ID used for routing from/to a stop.
+
+        The base graph routes between individual stops, so this is the
+        identity. Subclasses that merge platforms into stations override it.
+        """
+        return stop_id
+
     def has_connection(self, from_stop_id: str, to_stop_id: str) -> bool:
         """Check if direct connection exists between stops."""
         return self.graph.has_edge(from_stop_id, to_stop_id)
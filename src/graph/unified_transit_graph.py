@@ -24,14 +24,19 @@ class UnifiedTransitGraph(TransitGraph):
     - Merge connections from all transport modes
     - Identify transfer hubs (stops serving multiple modes)
     - Add inter-mode transfer edges with walking times
+    - Optionally collapse platforms into their parent station
     """
 
-    def __init__(self, multimodal_parser: MultiModalGTFSParser):
+    def __init__(self, multimodal_parser: MultiModalGTFSParser, collapse_platforms: bool = False):
         """
         Initialize unified multi-modal transit graph.
 
         Args:
             multimodal_parser: MultiModalGTFSParser with loaded data for all modes
+            collapse_platforms: Route between parent stations instead of individual
+                               platforms (GTFS parent_station). Shrinks the graph and
+                               removes platform-to-platform transfers, but legs then
+                               start/end at the station rather than a platform.
         """
         # Don't call super().__init__ with parser - we'll build manually
         super().__init__(gtfs_parser=None)
@@ -42,6 +47,9 @@ class UnifiedTransitGraph(TransitGraph):
         # Track which mode each stop/route belongs to
         self.stop_modes: Dict[str, str] = {}  # stop_id -> mode_id
         self.transfer_hubs: Dict[str, List[str]] = {}  # hub_name -> [stop_ids]
+        self._stop_to_hub: Dict[str, str] = {}  # stop_id -> hub_name (inverse of transfer_hubs)
+        self.collapse_platforms = collapse_platforms
+        self._station_of: Dict[str, str] = {}  # stop_id -> routing node (parent station when collapsing)
 
         # Build the unified graph
         self.build_unified_graph()
@@ -50,6 +58,9 @@ class UnifiedTransitGraph(TransitGraph):
         """Build unified graph from all transport modes."""
         logger.info("Building unified multi-modal transit graph...")
 
+        # Step 0: Map platforms to stations (identity unless collapsing)
+        self._build_station_map()
+
         # Step 1: Add all stop nodes
         self._add_all_stop_nodes()
 
@@ -73,9 +84,31 @@ class UnifiedTransitGraph(TransitGraph):
             f"{len(self.transfer_hubs)} transfer hubs"
         )
 
+    def _build_station_map(self):
+        """Map each stop to the node it is routed through."""
+        stops = self.multimodal_parser.stops
+        self._station_of = {}
+        for stop_id, stop in stops.items():
+            parent = stop.parent_station if self.collapse_platforms else None
+            self._station_of[stop_id] = parent if parent and parent in stops else stop_id
+
+        collapsed = sum(1 for stop_id, station_id in self._station_of.items() if stop_id != station_id)
+        if collapsed:
+            logger.info(f"Collapsed {collapsed} platforms into their parent stations")
+
+    def _routing_stops(self):
+        """Iterate (stop_id, stop) for stops that are graph nodes."""
+        for stop_id, stop in self.multimodal_parser.stops.items():
+            if self._station_of.get(stop_id, stop_id) == stop_id:
+                yield stop_id, stop
+
+    def get_station_id(self, stop_id: str) -> str:
+        """Get the routing node for a stop (its parent station when collapsing platforms)."""
+        return self._station_of.get(stop_id, stop_id)
+
     def _add_all_stop_nodes(self):
         """Add stop nodes from all transport modes."""
-        for stop_id, stop in self.multimodal_parser.stops.items():
+        for stop_id, stop in self._routing_stops():
             self.graph.add_node(
                 stop_id,
                 name=stop.stop_name,
@@ -89,11 +122,12 @@ class UnifiedTransitGraph(TransitGraph):
             if mode_id:
                 self.stop_modes[stop_id] = mode_id
 
-        logger.debug(f"Added {len(self.multimodal_parser.stops)} stop nodes")
+        logger.debug(f"Added {self.graph.number_of_nodes()} stop nodes")
 
     def _add_all_mode_connections(self):
         """Add trip connections from all transport modes."""
         total_connections = 0
+        station_of = self._station_of
 
         for mode_id, mode_parser in self.multimodal_parser.mode_parsers.items():
             mode_info = self.multimodal_parser.get_mode_info(mode_id)
@@ -117,6 +151,11 @@ class UnifiedTransitGraph(TransitGraph):
                     st_from = stop_times[i]
                     st_to = stop_times[i + 1]
 
+                    from_id = station_of.get(st_from.stop_id, st_from.stop_id)
+                    to_id = station_of.get(st_to.stop_id, st_to.stop_id)
+                    if from_id == to_id:
+                        continue  # Both platforms of one station after collapsing
+
                     # Calculate travel time
                     dep_seconds = self._time_to_seconds(st_from.departure_time)
                     arr_seconds = self._time_to_seconds(st_to.arrival_time)
@@ -128,8 +167,8 @@ class UnifiedTransitGraph(TransitGraph):
 
                     # Create connection
                     conn = Connection(
-                        from_stop_id=st_from.stop_id,
-                        to_stop_id=st_to.stop_id,
+                        from_stop_id=from_id,
+                        to_stop_id=to_id,
                         trip_id=trip_id,
                         departure_time=st_from.departure_time,
                         arrival_time=st_to.arrival_time,
@@ -140,7 +179,7 @@ class UnifiedTransitGraph(TransitGraph):
                         service_id=trip.service_id  # Include service calendar ID
                     )
 
-                    self.connections.append(conn)
+                    self.add_connection(conn)
                     total_connections += 1
 
             logger.debug(f"  Added connections for {mode_info['name']}")
@@ -160,7 +199,7 @@ class UnifiedTransitGraph(TransitGraph):
 
         # Group stops by name
         stops_by_name: Dict[str, List[str]] = defaultdict(list)
-        for stop_id, stop in self.multimodal_parser.stops.items():
+        for stop_id, stop in self._routing_stops():
             # Normalize name (remove platform info, lowercase)
             normalized_name = self._normalize_stop_name(stop.stop_name)
             stops_by_name[normalized_name].append(stop_id)
@@ -178,14 +217,22 @@ class UnifiedTransitGraph(TransitGraph):
         # Also identify nearby stops (coordinate-based matching)
         self._identify_nearby_hubs()
 
+        # Invert hubs for O(1) stop -> hub lookups. A stop can appear in more
+        # than one hub; the first hub (in insertion order) wins.
+        self._stop_to_hub = {}
+        for hub_name, stop_ids in self.transfer_hubs.items():
+            for stop_id in stop_ids:
+                self._stop_to_hub.setdefault(stop_id, hub_name)
+
         logger.info(f"Identified {len(self.transfer_hubs)} transfer hubs")
 
     def _identify_nearby_hubs(self):
         """Identify hubs by coordinate proximity (same physical location)."""
         # Get all unique stop coordinates
         processed = set()
+        routing_stops = list(self._routing_stops())
 
-        for stop_id1, stop1 in self.multimodal_parser.stops.items():
+        for stop_id1, stop1 in routing_stops:
             if stop_id1 in processed:
                 continue
 
@@ -194,7 +241,7 @@ class UnifiedTransitGraph(TransitGraph):
             nearby_stops = [stop_id1]
 
             # Find all stops within 100m
-            for stop_id2, stop2 in self.multimodal_parser.stops.items():
+            for stop_id2, stop2 in routing_stops:
                 if stop_id2 == stop_id1 or stop_id2 in processed:
                     continue
 
@@ -226,6 +273,9 @@ class UnifiedTransitGraph(TransitGraph):
     def _add_intermode_transfers(self):
         """Add walking transfer connections between stops at transfer hubs."""
         transfer_count = 0
+        # A stop pair can share several hubs (name and coordinate matches);
+        # only one walking transfer per direction is needed
+        added_pairs: Set[Tuple[str, str]] = set()
 
         for hub_name, stop_ids in self.transfer_hubs.items():
             # Create transfer edges between all pairs of stops at this hub
@@ -240,6 +290,10 @@ class UnifiedTransitGraph(TransitGraph):
                 for dest_stop_id in stop_ids[i+1:]:  # Only forward pairs to avoid duplicates
                     if origin_stop_id == dest_stop_id:
                         continue
+                    if (origin_stop_id, dest_stop_id) in added_pairs:
+                        continue
+                    added_pairs.add((origin_stop_id, dest_stop_id))
+                    added_pairs.add((dest_stop_id, origin_stop_id))
 
                     dest_stop = self.multimodal_parser.get_stop(dest_stop_id)
                     if not dest_stop:
@@ -273,7 +327,7 @@ class UnifiedTransitGraph(TransitGraph):
                             service_id=None  # Transfers have no service calendar (always available)
                         )
 
-                        self.connections.append(transfer_conn)
+                        self.add_connection(transfer_conn)
                         transfer_count += 1
 
         logger.info(f"Added {transfer_count} inter-mode transfer connections")
@@ -320,14 +374,8 @@ class UnifiedTransitGraph(TransitGraph):
 
     def is_transfer_hub(self, stop_id: str) -> bool:
         """Check if a stop is part of a transfer hub."""
-        for stop_ids in self.transfer_hubs.values():
-            if stop_id in stop_ids:
-                return True
-        return False
+        return stop_id in self._stop_to_hub
 
     def get_hub_for_stop(self, stop_id: str) -> Optional[str]:
         """Get the hub name for a given stop (if it's part of a hub)."""
-        for hub_name, stop_ids in self.transfer_hubs.items():
-            if stop_id in stop_ids:
-                return hub_name
-        return None
+        return self._stop_to_hub.get(stop_id)
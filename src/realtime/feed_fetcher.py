@@ -112,6 +112,9 @@ class GTFSRealtimeFetcher:
         self.api_key = api_key
         self.timeout = timeout
 
+        # Keep-alive session so repeated feed fetches reuse the TLS connection
+        self._session = requests.Session()
+
         # Initialize 30-second TTL cache per architecture spec
         self._cache_enabled = enable_cache
         if enable_cache:
@@ -162,7 +165,7 @@ class GTFSRealtimeFetcher:
             }
 
             logger.debug(f"Fetching GTFS Realtime feed from: {url}")
-            response = requests.get(url, headers=headers, timeout=self.timeout)
+            response = self._session.get(url, headers=headers, timeout=self.timeout)
             response.raise_for_status()
 
             # Parse the protobuf feed
@@ -64,6 +64,7 @@ class RealtimeIntegrator:
         """
         self.fetcher = fetcher
         self._trip_updates_cache: Dict[str, Dict[str, TripUpdateInfo]] = {}  # mode → trip_id → info
+        self._trip_updates_source: Dict[str, object] = {}  # mode → feed the cache was parsed from
 
     def apply_realtime_to_journey(
         self,
@@ -96,8 +97,8 @@ class RealtimeIntegrator:
         # Fetch and parse realtime data
         try:
             feed = self.fetcher.fetch_trip_updates(mode=mode)
-            trip_updates = self._parse_trip_updates(feed)
-            logger.info(f"Parsed {len(trip_updates)} trip updates from realtime feed")
+            trip_updates = self._get_trip_updates(mode, feed)
+            logger.info(f"Using {len(trip_updates)} trip updates from realtime feed")
         except Exception as e:
             logger.warning(f"Failed to fetch realtime data: {e}. Using scheduled times.")
             return journey  # Return unchanged journey
@@ -149,6 +150,28 @@ class RealtimeIntegrator:
         logger.info(f"Realtime integration complete. Delay: {total_delay}s, Valid: {journey.is_realtime_valid}")
         return journey
 
+    def _get_trip_updates(self, mode: str, feed) -> Dict[str, TripUpdateInfo]:
+        """
+        Get parsed trip updates for a feed, reusing the last parse if unchanged.
+
+        The fetcher returns the same FeedMessage object while its TTL cache
+        is fresh, so concurrent journey requests share one parse per feed.
+
+        Args:
+            mode: Transport mode the feed belongs to
+            feed: FeedMessage returned by the fetcher
+
+        Returns:
+            Dictionary mapping trip_id → TripUpdateInfo
+        """
+        if self._trip_updates_source.get(mode) is feed:
+            return self._trip_updates_cache[mode]
+
+        trip_updates = self._parse_trip_updates(feed)
+        self._trip_updates_cache[mode] = trip_updates
+        self._trip_updates_source[mode] = feed
+        return trip_updates
+
     def _parse_trip_updates(self, feed) -> Dict[str, TripUpdateInfo]:
         """
         Parse GTFS Realtime feed into structured trip updates.
@@ -7,7 +7,7 @@ to query alerts by route, stop, or trip.
 
 import logging
 import time
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .models import (
     ServiceAlert,
@@ -80,6 +80,10 @@ class ServiceAlertParser:
         """
         self.fetcher = fetcher
         self._cache: Dict[str, List[ServiceAlert]] = {}  # mode → alerts
+        self._lookup_cache: Dict[Tuple[str, str], List[ServiceAlert]] = {}  # (kind, id) → cached-alert matches
+        self._feed_source: Dict[str, Any] = {}  # mode → feed the cached alerts were parsed from
+        # mode → (alerts list the index was built from, (kind, key) → alert indices)
+        self._mode_index: Dict[str, Tuple[List[ServiceAlert], Dict[Tuple[str, Any], List[int]]]] = {}
 
     def parse_feed(self, feed) -> List[ServiceAlert]:
         """
@@ -223,14 +227,24 @@ class ServiceAlertParser:
         if not has_service_alerts(mode):
             logger.info(f"Service alerts not available for mode: {mode}. Returning empty list.")
             self._cache[mode] = []
+            self._feed_source.pop(mode, None)
+            self._lookup_cache.clear()
             return []
 
         logger.info(f"Fetching service alerts for mode: {mode}")
 
         try:
             feed = self.fetcher.fetch_service_alerts(mode=mode)
+
+            # The fetcher serves the same feed object until its TTL expires;
+            # reuse the previous parse (and lookups) instead of re-parsing
+            if self._feed_source.get(mode) is feed and mode in self._cache:
+                return self._cache[mode]
+
             alerts = self.parse_feed(feed)
             self._cache[mode] = alerts
+            self._feed_source[mode] = feed
+            self._lookup_cache.clear()
             return alerts
         except Exception as e:
             logger.error(f"Failed to fetch service alerts: {e}")
@@ -252,7 +266,7 @@ class ServiceAlertParser:
             List of ServiceAlert objects affecting the route
         """
         if alerts is None:
-            alerts = self._get_cached_alerts()
+            return self._filter_cached('route', route_id, lambda a: a.affects_route(route_id))
 
         return [a for a in alerts if a.affects_route(route_id)]
 
@@ -272,7 +286,7 @@ class ServiceAlertParser:
             List of ServiceAlert objects affecting the stop
         """
         if alerts is None:
-            alerts = self._get_cached_alerts()
+            return self._filter_cached('stop', stop_id, lambda a: a.affects_stop(stop_id))
 
         return [a for a in alerts if a.affects_stop(stop_id)]
 
@@ -292,7 +306,7 @@ class ServiceAlertParser:
             List of ServiceAlert objects affecting the trip
         """
         if alerts is None:
-            alerts = self._get_cached_alerts()
+            return self._filter_cached('trip', trip_id, lambda a: a.affects_trip(trip_id))
 
         return [a for a in alerts if a.affects_trip(trip_id)]
 
@@ -388,6 +402,70 @@ class ServiceAlertParser:
             return mode_alerts
         return []
 
+    def _filter_cached(
+        self,
+        kind: str,
+        key: str,
+        predicate: Callable[[ServiceAlert], bool]
+    ) -> List[ServiceAlert]:
+        """
+        Filter the cached alerts, memoising the result until the next fetch.
+
+        Args:
+            kind: Lookup type ('route', 'stop' or 'trip')
+            key: ID being looked up
+            predicate: Test applied to each cached alert
+
+        Returns:
+            New list of matching ServiceAlert objects
+        """
+        matches = self._lookup_cache.get((kind, key))
+        if matches is None:
+            matches = [a for a in self._get_cached_alerts() if predicate(a)]
+            self._lookup_cache[(kind, key)] = matches
+        return list(matches)
+
+    def lookup_alerts(self, mode: str, kind: str, key: Any) -> List[ServiceAlert]:
+        """
+        Look up fetched alerts for a mode by route, stop or severity.
+
+        The first lookup after a fetch builds an inverted index over that
+        mode's alerts, so later lookups are dict hits rather than scans of
+        every alert's informed entities.
+
+        Args:
+            mode: Transport mode previously passed to fetch_alerts()
+            kind: Lookup type ('route', 'stop' or 'severity')
+            key: Route ID, stop ID or AlertSeverity to match
+
+        Returns:
+            New list of matching ServiceAlert objects, in feed order
+        """
+        alerts = self._cache.get(mode, [])
+        # The index is stored with the list it was built from and only used
+        # for that same list, so a concurrent fetch_alerts() replacing
+        # _cache[mode] can never pair new alerts with a stale index
+        entry = self._mode_index.get(mode)
+        if entry is None or entry[0] is not alerts:
+            entry = (alerts, self._build_index(alerts))
+            self._mode_index[mode] = entry
+        return [alerts[i] for i in entry[1].get((kind, key), ())]
+
+    @staticmethod
+    def _build_index(alerts: List[ServiceAlert]) -> Dict[Tuple[str, Any], List[int]]:
+        """Map ('route'|'stop'|'severity', key) to indices of matching alerts."""
+        index: Dict[Tuple[str, Any], List[int]] = {}
+        for i, alert in enumerate(alerts):
+            keys = {('severity', alert.severity)}
+            for entity in alert.informed_entities:
+                if entity.route_id:
+                    keys.add(('route', entity.route_id))
+                if entity.stop_id:
+                    keys.add(('stop', entity.stop_id))
+            for key in keys:
+                index.setdefault(key, []).append(i)
+        return index
+
     def get_summary(
         self,
         alerts: List[ServiceAlert],
@@ -438,4 +516,7 @@ class ServiceAlertParser:
     def clear_cache(self) -> None:
         """Clear the service alerts cache."""
         self._cache.clear()
+        self._lookup_cache.clear()
+        self._feed_source.clear()
+        self._mode_index.clear()
         logger.debug("Service alert cache cleared")
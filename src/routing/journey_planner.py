@@ -12,6 +12,8 @@ from datetime import datetime, timedelta
 import logging
 import sys
 
+import numpy as np
+
 from ..data.gtfs_parser import GTFSParser
 from ..data.models import StopTime
 from ..graph.transit_graph import TransitGraph, Connection
@@ -70,6 +72,10 @@ class JourneyPlanner:
             f"Finding journey: {origin_stop_id} -> {destination_stop_id} at {departure_time}"
         )
 
+        # Map platforms to their routing node (identity unless the graph merges platforms)
+        origin_stop_id = self.graph.get_station_id(origin_stop_id)
+        destination_stop_id = self.graph.get_station_id(destination_stop_id)
+
         # Validate stops exist
         if not self.graph.has_stop(origin_stop_id):
             logger.warning(f"Origin stop {origin_stop_id} not found")
@@ -132,9 +138,27 @@ class JourneyPlanner:
         # Use pre-sorted connections from graph (optimization)
         all_connections = self.graph.get_sorted_connections()
 
-        # Separate regular connections and transfers
-        regular_connections = [c for c in all_connections if not c.is_transfer]
-        transfer_connections = [c for c in all_connections if c.is_transfer]
+        # Separate regular connections and transfers (transfers are sorted last)
+        first_transfer = self.graph.get_first_transfer_index()
+        regular_connections = all_connections[:first_transfer]
+        transfer_connections = all_connections[first_transfer:]
+
+        # Pre-parsed times, parallel to all_connections; regular departures are ascending
+        all_departures, all_arrivals = self.graph.get_sorted_times()
+        regular_departures = all_departures[:first_transfer]
+        regular_arrivals = all_arrivals[:first_transfer]
+
+        def timed(lo: int, hi: int, date: str, dow: int) -> List[Tuple[Connection, int, int]]:
+            """(connection, dep_seconds, arr_seconds) for regular_connections[lo:hi] running on date."""
+            return [
+                (c, dep, arr)
+                for c, dep, arr in zip(
+                    regular_connections[lo:hi],
+                    regular_departures[lo:hi].tolist(),
+                    regular_arrivals[lo:hi].tolist()
+                )
+                if c.service_id is None or self._is_trip_operating(c.service_id, date, dow)
+            ]
 
         # Get current date and day of week for service calendar validation
         now = datetime.now()
@@ -145,18 +169,16 @@ class JourneyPlanner:
         # Most journeys complete within 4 hours
         time_window_seconds = 4 * 3600
 
-        # Keep original list for future day searching if needed
-        regular_connections_backup = regular_connections
-
         # First, try to find trips today within the time window
         # Don't let max_time exceed midnight (86400 seconds)
         max_time_today = min(dep_seconds + time_window_seconds, 86400)
 
-        today_connections = [
-            c for c in regular_connections
-            if (dep_seconds <= self._time_to_seconds(c.departure_time) < 86400
-                and (c.service_id is None or self._is_trip_operating(c.service_id, check_date, day_of_week)))
-        ]
+        # Departures are sorted, so the window is a contiguous slice
+        today_connections = timed(
+            int(np.searchsorted(regular_departures, dep_seconds, side='left')),
+            int(np.searchsorted(regular_departures, 86400, side='left')),
+            check_date, day_of_week
+        )
 
         # If no connections found today AND time window extends past midnight,
         # search tomorrow's early morning trips
@@ -168,20 +190,20 @@ class JourneyPlanner:
             # Calculate how far into tomorrow we should search
             max_time_tomorrow = (dep_seconds + time_window_seconds) - 86400
 
-            tomorrow_connections = [
-                c for c in regular_connections_backup
-                if (0 <= self._time_to_seconds(c.departure_time) <= max_time_tomorrow
-                    and (c.service_id is None or self._is_trip_operating(c.service_id, tomorrow_date, tomorrow_dow)))
-            ]
+            tomorrow_connections = timed(
+                int(np.searchsorted(regular_departures, 0, side='left')),
+                int(np.searchsorted(regular_departures, max_time_tomorrow, side='right')),
+                tomorrow_date, tomorrow_dow
+            )
 
-            regular_connections = tomorrow_connections
+            scan_connections = tomorrow_connections
             logger.debug(f"No service today in time window, checking tomorrow: {len(tomorrow_connections):,} connections")
         else:
-            regular_connections = today_connections
+            scan_connections = today_connections
 
         # If STILL no connections (no service today or in time window),
         # find the next available trip (could be tomorrow or later)
-        if not regular_connections:
+        if not scan_connections:
             logger.info("No service in time window, searching up to 7 days ahead...")
             # Search up to 7 days ahead for next available trip
             for days_ahead in range(1, 8):
@@ -190,25 +212,19 @@ class JourneyPlanner:
                 future_dow = future_date_obj.weekday()
 
                 # Look for trips starting from 00:00 on this future day
-                future_connections = [
-                    c for c in regular_connections_backup
-                    if (c.service_id is None or self._is_trip_operating(c.service_id, future_date, future_dow))
-                ]
+                future_connections = timed(0, first_transfer, future_date, future_dow)
 
                 if future_connections:
                     # Found trips on this day, take earliest ones (limit to prevent performance issues)
-                    future_connections.sort(key=lambda c: self._time_to_seconds(c.departure_time))
-                    regular_connections = future_connections[:1000]  # Limit to first 1000 connections
-                    logger.info(f"Found next service on {future_date} ({days_ahead} days ahead): {len(regular_connections):,} connections")
+                    # (already in departure order)
+                    scan_connections = future_connections[:1000]  # Limit to first 1000 connections
+                    logger.info(f"Found next service on {future_date} ({days_ahead} days ahead): {len(scan_connections):,} connections")
                     break
 
-        logger.debug(f"Filtered to {len(regular_connections):,} connections with calendar validation")
+        logger.debug(f"Filtered to {len(scan_connections):,} connections with calendar validation")
 
         # Phase 1: Scan regular timetabled connections
-        for conn in regular_connections:
-            dep_time = self._time_to_seconds(conn.departure_time)
-            arr_time = self._time_to_seconds(conn.arrival_time)
-
+        for conn, dep_time, arr_time in scan_connections:
             # Skip connections that depart before we can reach the departure stop
             if dep_time < earliest_arrival[conn.from_stop_id]:
                 continue
@@ -262,10 +278,7 @@ class JourneyPlanner:
 
             # After transfers, scan regular connections again
             # to see if newly reachable stops can catch new trips
-            for conn in regular_connections:
-                dep_time = self._time_to_seconds(conn.departure_time)
-                arr_time = self._time_to_seconds(conn.arrival_time)
-
+            for conn, dep_time, arr_time in scan_connections:
                 if dep_time < earliest_arrival[conn.from_stop_id]:
                     continue
 
@@ -391,10 +404,9 @@ class JourneyPlanner:
         trip = self.parser.get_trip(first_conn.trip_id)
         route = self.parser.get_route(first_conn.route_id) if first_conn.route_id else None
 
-        # Build list of intermediate stops with coordinates
+        # Build list of intermediate stops (callers look up coordinates by ID)
         intermediate_stops = []
         intermediate_stop_ids = []
-        intermediate_coords = []
 
         for conn in connections:
             # Add the destination stop of each connection (which becomes next stop's origin)
@@ -403,12 +415,6 @@ class JourneyPlanner:
                 # Don't include the final destination in intermediate list
                 intermediate_stops.append(stop.stop_name)
                 intermediate_stop_ids.append(conn.to_stop_id)
-                intermediate_coords.append({
-                    "name": stop.stop_name,
-                    "id": conn.to_stop_id,
-                    "lat": float(stop.stop_lat),
-                    "lon": float(stop.stop_lon)
-                })
 
         return Leg(
             from_stop_id=first_conn.from_stop_id,
@@ -424,8 +430,7 @@ class JourneyPlanner:
             is_transfer=first_conn.is_transfer,
             num_stops=len(connections) + 1,  # Number of stops including first and last
             intermediate_stops=intermediate_stops,  # List of intermediate stop names
-            intermediate_stop_ids=intermediate_stop_ids,  # List of intermediate stop IDs
-            intermediate_coords=intermediate_coords  # List of intermediate stop coordinates
+            intermediate_stop_ids=intermediate_stop_ids  # List of intermediate stop IDs
         )
 
     def _time_to_seconds(self, time_str: str) -> int:
@@ -530,6 +535,9 @@ class JourneyPlanner:
         Returns:
             List of Journey objects, sorted by duration (fastest first)
         """
+        origin_stop_id = self.graph.get_station_id(origin_stop_id)
+        destination_stop_id = self.graph.get_station_id(destination_stop_id)
+
         journeys = []
         banned_connection_sets: List[Set[Tuple[str, str, str]]] = []  # (from_stop, to_stop, trip_id)
 
@@ -601,9 +609,10 @@ class JourneyPlanner:
         num_transfers[origin_stop_id] = 0
 
         all_connections = self.graph.get_sorted_connections()
+        all_departures, all_arrivals = self.graph.get_sorted_times()
 
         # Scan all connections
-        for conn in all_connections:
+        for conn, conn_dep, conn_arr in zip(all_connections, all_departures.tolist(), all_arrivals.tolist()):
             # Check if this connection is banned
             conn_tuple = (conn.from_stop_id, conn.to_stop_id, conn.trip_id)
             is_banned = any(conn_tuple in banned_set for banned_set in banned_connection_sets)
@@ -621,8 +630,8 @@ class JourneyPlanner:
                     continue
             else:
                 # Regular timetabled connection
-                dep_time = self._time_to_seconds(conn.departure_time)
-                arr_time = self._time_to_seconds(conn.arrival_time)
+                dep_time = conn_dep
+                arr_time = conn_arr
 
                 # Skip if we can't reach the departure stop in time
                 if dep_time < earliest_arrival[conn.from_stop_id]:
@@ -10,6 +10,18 @@ from typing import List, Optional
 from datetime import datetime, timedelta
 
 
+# GTFS route_type -> human-readable mode name
+MODE_NAMES = {
+    0: "Tram",
+    1: "Metro",
+    2: "Regional Train",
+    3: "Bus",
+    4: "Ferry",
+    700: "Bus",  # PTV uses 700 for buses
+    900: "Tram"   # PTV uses 900 for trams
+}
+
+
 @dataclass
 class Leg:
     """
@@ -41,10 +53,6 @@ class Leg:
     # NEW: Intermediate stop IDs for coordinate lookup
     intermediate_stop_ids: List[str] = field(default_factory=list)
 
-    # NEW: Intermediate stop coordinates for map visualization
-    # Format: [{"name": str, "id": str, "lat": float, "lon": float}, ...]
-    intermediate_coords: List[dict] = field(default_factory=list)
-
     # Realtime fields (Phase 5)
     scheduled_departure_time: Optional[str] = None  # For realtime comparison
     actual_departure_time: Optional[str] = None  # With delay applied
@@ -58,6 +66,11 @@ class Leg:
     platform_name: Optional[str] = None  # "Platform 5", "Track 1"
     has_realtime_data: bool = False  # Whether realtime info is available
 
+    # Transfer details (filled in for walking transfers by TransferJourneyPlanner)
+    from_platform: Optional[str] = None
+    to_platform: Optional[str] = None
+    transfer_hub_name: Optional[str] = None
+
     def __post_init__(self):
         """Validate and convert types."""
         self.num_stops = int(self.num_stops)
@@ -68,16 +81,7 @@ class Leg:
         """Get human-readable mode name."""
         if self.is_transfer:
             return "Walking"
-        mode_map = {
-            0: "Tram",
-            1: "Metro",
-            2: "Regional Train",
-            3: "Bus",
-            4: "Ferry",
-            700: "Bus",  # PTV uses 700 for buses
-            900: "Tram"   # PTV uses 900 for trams
-        }
-        return mode_map.get(self.route_type, "Unknown")
+        return MODE_NAMES.get(self.route_type, "Unknown")
 
     @property
     def duration_seconds(self) -> int:
@@ -308,6 +312,8 @@ class Journey:
 
         lines.append("")
 
+        wait_times = self.get_transfer_wait_times()
+
         for i, leg in enumerate(self.legs, 1):
             lines.append(f"Leg {i}:")
             lines.append(f"  {leg.from_stop_name} → {leg.to_stop_name}")
@@ -342,7 +348,6 @@ class Journey:
 
             # Add transfer wait time if not last leg
             if i < len(self.legs):
-                wait_times = self.get_transfer_wait_times()
                 if wait_times:
                     wait_mins = wait_times[i - 1] // 60
                     lines.append(f"  Transfer wait: {wait_mins}m")
@@ -55,14 +55,11 @@ class TransferJourneyPlanner:
         max_transfers: int = 4
     ) -> Optional[Journey]:
         """
-        Find single best journey using two-tier search strategy.
+        Find single best journey.
 
-        Strategy:
-        1. Try direct route first (same mode, no transfers) - FAST
-        2. If no direct route, try multi-modal with transfers - SLOWER but necessary
-
-        This provides excellent performance for most queries while still
-        handling complex multi-modal journeys when needed.
+        The underlying connection scan already searches direct and
+        multi-modal routes (with transfers) in a single pass, so one
+        search is enough.
 
         Args:
             origin_stop_id: Origin stop ID
@@ -79,36 +76,18 @@ class TransferJourneyPlanner:
 
         logger.info(f"Finding best journey: {origin_stop_id} → {destination_stop_id} at {departure_time}")
 
-        # TIER 1: Try direct route (same mode, fast search)
-        logger.debug("Tier 1: Trying direct route (same mode only)...")
-        direct_journey = self.base_planner.find_journey(
+        journey = self.base_planner.find_journey(
             origin_stop_id,
             destination_stop_id,
             departure_time
         )
 
-        if direct_journey:
-            logger.info(f"✓ Found direct route: {direct_journey.duration_minutes}m, "
-                       f"{direct_journey.num_transfers} transfers")
-            self._enhance_transfer_info(direct_journey)
-            return direct_journey
-
-        # TIER 2: Try multi-modal with transfers (slower)
-        logger.debug("Tier 1 failed. Tier 2: Trying multi-modal with transfers...")
-
-        # Use find_journey which already has the iterative transfer logic
-        multi_journey = self.base_planner.find_journey(
-            origin_stop_id,
-            destination_stop_id,
-            departure_time
-        )
-
-        if multi_journey:
-            logger.info(f"✓ Found multi-modal route: {multi_journey.duration_minutes}m, "
-                       f"{multi_journey.num_transfers} transfers, "
-                       f"modes: {', '.join(multi_journey.get_modes_used())}")
-            self._enhance_transfer_info(multi_journey)
-            return multi_journey
+        if journey:
+            logger.info(f"✓ Found route: {journey.duration_minutes}m, "
+                       f"{journey.num_transfers} transfers, "
+                       f"modes: {', '.join(journey.get_modes_used())}")
+            self._enhance_transfer_info(journey)
+            return journey
 
         logger.info("✗ No route found")
         return None
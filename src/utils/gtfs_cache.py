@@ -0,0 +1,175 @@
+"""
+On-disk pickle cache for loaded GTFS data.
+
+Parsing GTFS CSVs and building the transit graph takes seconds to minutes,
+but the result is read-only once built. This module pickles the built
+objects keyed by the modification times of the source GTFS files and the
+contents of the ``src`` package, so repeated script runs only pay for
+unpickling and a deploy that changes the pickled classes rebuilds.
+
+Usage:
+    from src.utils.gtfs_cache import load_cached
+
+    def build():
+        parser = MultiModalGTFSParser(base_gtfs_dir="data/gtfs", modes_to_load=['1'])
+        parser.load_all()
+        return parser
+
+    parser = load_cached("data/gtfs", build, name="vline")
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, TypeVar, Union
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar('T')
+
+DEFAULT_CACHE_DIR = Path(".cache") / "gtfs"
+
+# Package whose classes end up in the pickles (parser, graph, planner)
+SRC_DIR = Path(__file__).resolve().parent.parent
+
+
+@lru_cache(maxsize=1)
+def _code_fingerprint() -> str:
+    """
+    Hash the source of the ``src`` package.
+
+    Pickles restore instances without running ``__init__``, so an object
+    pickled by older code can load cleanly but lack attributes the new code
+    expects. Keying on the code makes such caches miss instead.
+
+    Returns:
+        Hex digest of every ``.py`` file under ``src``
+    """
+    digest = hashlib.sha1()
+    for path in sorted(SRC_DIR.rglob("*.py")):
+        digest.update(path.relative_to(SRC_DIR).as_posix().encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def gtfs_cache_key(source_dir: Union[str, Path]) -> str:
+    """
+    Compute a cache key for the GTFS files under a directory.
+
+    The key changes whenever any ``.txt`` file under ``source_dir`` is
+    added, removed, resized or modified, and whenever the ``src`` code
+    that builds the cached objects changes.
+
+    Args:
+        source_dir: Directory containing GTFS ``.txt`` files (searched recursively)
+
+    Returns:
+        Hex digest identifying the current state of the GTFS files
+    """
+    digest = hashlib.sha1(_code_fingerprint().encode("utf-8"))
+    for path in sorted(Path(source_dir).rglob("*.txt")):
+        stat = path.stat()
+        digest.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def save_cache(obj: Any, path: Union[str, Path]) -> None:
+    """
+    Pickle an object to disk atomically.
+
+    Each call writes its own uniquely named temp file before renaming it
+    into place, so several processes (e.g. API workers starting on a cold
+    cache) can save concurrently without tearing each other's output.
+
+    Args:
+        obj: Object to pickle
+        path: Destination file path
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(obj, f, protocol=5)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_cache(path: Union[str, Path]) -> Any:
+    """
+    Load a pickled object from disk.
+
+    Args:
+        path: File path written by save_cache()
+
+    Returns:
+        The unpickled object
+    """
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def load_cached(
+    source_dir: Union[str, Path],
+    build: Callable[[], T],
+    name: str = "gtfs",
+    cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR
+) -> T:
+    """
+    Return the cached result of build(), rebuilding when GTFS files change.
+
+    Unreadable or stale cache files (e.g. written by an incompatible
+    version of the code) are ignored and replaced. When a new cache file
+    is written, older files for the same name are removed.
+
+    Args:
+        source_dir: GTFS directory the build depends on
+        build: Zero-argument function that loads/builds the object
+        name: Name prefix for the cache file
+        cache_dir: Directory for cache files
+
+    Returns:
+        The built (or unpickled) object
+    """
+    path = Path(cache_dir) / f"{name}-{gtfs_cache_key(source_dir)}.pkl"
+
+    if path.exists():
+        try:
+            obj = load_cache(path)
+            logger.info(f"Loaded {name} from cache {path}")
+            return obj
+        except Exception as e:
+            # A truncated or incompatible pickle can fail in many ways
+            # (ValueError, KeyError, TypeError, ...); always fall back to a rebuild
+            logger.warning(f"Ignoring unreadable cache {path}: {e}")
+
+    obj = build()
+
+    try:
+        save_cache(obj, path)
+        logger.info(f"Saved {name} to cache {path}")
+    except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+        logger.warning(f"Could not write cache {path}: {e}")
+        return obj
+
+    _remove_stale(path, name)
+    return obj
+
+
+def _remove_stale(current: Path, name: str) -> None:
+    """Delete cache files for ``name`` other than ``current``."""
+    for other in current.parent.glob(f"{name}-*.pkl"):
+        # Names may share a prefix (e.g. "modes-1" and "modes-1-2"), so
+        # compare everything before the key exactly
+        if other != current and other.stem.rsplit("-", 1)[0] == name:
+            try:
+                other.unlink()
+            except OSError as e:
+                logger.warning(f"Could not remove stale cache {other}: {e}")
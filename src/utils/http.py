@@ -0,0 +1,73 @@
+"""
+Shared HTTP session for downloading static data.
+
+Reusing one requests.Session keeps TCP/TLS connections alive between
+downloads (e.g. one GTFS archive per mode), instead of paying a new
+handshake for every file.
+
+Usage:
+    from src.utils.http import get_http_session
+
+    response = get_http_session().get(url, stream=True, timeout=300)
+"""
+
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Retry transient server errors on idempotent requests
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 1.0
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+
+def create_http_session(
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+    pool_connections: int = 8,
+    pool_maxsize: int = 16
+) -> requests.Session:
+    """
+    Create a requests.Session with connection pooling and retries.
+
+    Args:
+        max_retries: Total retries for connection errors and 5xx responses
+        backoff_factor: Exponential backoff factor between retries (seconds)
+        pool_connections: Number of per-host connection pools to cache
+        pool_maxsize: Maximum connections kept alive per host
+
+    Returns:
+        Configured session, mounted for both http:// and https://
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(['GET', 'HEAD'])
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+@lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """
+    Get the process-wide shared HTTP session.
+
+    The session is thread-safe for concurrent GETs (urllib3 pools are
+    thread-safe), so it can be shared by parallel downloads.
+
+    Returns:
+        Shared requests.Session
+    """
+    return create_http_session()
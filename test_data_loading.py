@@ -34,7 +34,7 @@ for folder, desc in folders.items():
         parser.load_routes()
 
         # Get first route to verify route_type
-        first_route = list(parser.routes.values())[0] if parser.routes else None
+        first_route = next(iter(parser.routes.values()), None)
         route_type = first_route.route_type if first_route else 'N/A'
 
         print(f"Folder {folder}: {desc}")
@@ -73,7 +73,7 @@ for path in GTFS_PATHS:
         parser.load_stops()
         parser.load_routes()
         print(f"✓ SUCCESS: Loaded {len(parser.stops)} stops from {path}")
-        print(f"  First stop: {list(parser.stops.values())[0].stop_name}")
+        print(f"  First stop: {next(iter(parser.stops.values())).stop_name}")
         break
     except FileNotFoundError:
         print(f"✗ NOT FOUND: {path}")
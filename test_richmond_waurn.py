@@ -10,6 +10,7 @@ if sys.platform == 'win32':
 from src.data.multimodal_parser import MultiModalGTFSParser
 from src.data.stop_index import StopIndex
 from src.routing.multimodal_planner import MultiModalJourneyPlanner
+from src.utils.gtfs_cache import load_cached
 
 print("="*60)
 print("Testing: Richmond → Waurn Ponds")
@@ -17,8 +18,13 @@ print("="*60)
 
 # Load data
 print("\n1. Loading GTFS data...")
-parser = MultiModalGTFSParser(base_gtfs_dir='data/gtfs', modes_to_load=['1', '2', '3'])
-parser.load_all()
+def load_parser():
+    parser = MultiModalGTFSParser(base_gtfs_dir='data/gtfs', modes_to_load=['1', '2', '3'])
+    parser.load_all()
+    return parser
+
+
+parser = load_cached('data/gtfs', load_parser, name='multimodal-1-2-3')
 print(f"✓ Loaded {len(parser.stops)} stops")
 
 # Check which modes have which stations
@@ -16,6 +16,7 @@ from google.transit import gtfs_realtime_pb2
 from src.api.main import app
 from src.api.dependencies import reset_transit_service, TransitService
 import src.api.dependencies as deps
+import src.api.routes.alerts as alerts_routes
 from src.realtime.models import (
     ServiceAlert,
     InformedEntity,
@@ -233,6 +234,42 @@ class TestGetAllAlerts:
 
         assert response.status_code == 200
 
+    def test_get_alerts_not_modified(self, client, mock_alert_feed):
+        """Test a matching If-None-Match returns 304 with no body."""
+        mock_fetcher = Mock()
+        mock_fetcher.fetch_service_alerts.return_value = mock_alert_feed
+
+        with patch.object(
+            deps._transit_service,
+            'get_realtime_fetcher',
+            return_value=mock_fetcher
+        ):
+            first = client.get("/api/v1/alerts?mode=metro")
+            etag = first.headers["etag"]
+            second = client.get("/api/v1/alerts?mode=metro", headers={"If-None-Match": etag})
+
+        assert "max-age" in first.headers["cache-control"]
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+
+    def test_get_alerts_called_directly(self, mock_alert_feed):
+        """Test the handler works as a plain call without resolved Header defaults."""
+        mock_fetcher = Mock()
+        mock_fetcher.fetch_service_alerts.return_value = mock_alert_feed
+
+        with patch.object(
+            deps._transit_service,
+            'get_realtime_fetcher',
+            return_value=mock_fetcher
+        ):
+            response = alerts_routes.get_all_alerts(
+                mode="metro", active_only=True, service=deps._transit_service
+            )
+
+        assert response.status_code == 200
+        assert alerts_routes.AlertListResponse.model_validate_json(response.body).count > 0
+
 
 class TestGetAlertSummary:
     """Tests for GET /api/v1/alerts/summary endpoint."""
@@ -549,3 +586,25 @@ class TestErrorHandling:
             response = client.get("/api/v1/alerts/severity/WARNING")
 
         assert response.status_code == 503
+
+
+class TestAlertResponseCache:
+    """Tests for reuse of converted alert responses."""
+
+    def test_unchanged_alert_reuses_response(self):
+        """Test an equal alert returns the cached response object."""
+        from src.api.routes.alerts import _alert_to_response
+
+        first = _alert_to_response(ServiceAlert(alert_id="cache-1", header_text="Delays"))
+        second = _alert_to_response(ServiceAlert(alert_id="cache-1", header_text="Delays"))
+
+        assert second is first
+
+    def test_changed_alert_rebuilds_response(self):
+        """Test an edited alert with the same ID is converted again."""
+        from src.api.routes.alerts import _alert_to_response
+
+        _alert_to_response(ServiceAlert(alert_id="cache-2", header_text="Delays"))
+        updated = _alert_to_response(ServiceAlert(alert_id="cache-2", header_text="Buses replace trains"))
+
+        assert updated.header_text == "Buses replace trains"
@@ -7,8 +7,10 @@ import pytest
 from fastapi.testclient import TestClient
 
 from src.api.main import app
+from src.api.models import HealthResponse
 from src.api.dependencies import reset_transit_service, TransitService
 import src.api.dependencies as deps
+import src.api.routes.health as health_routes
 
 # Path to test fixtures
 FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "test_data", "fixtures")
@@ -77,6 +79,19 @@ class TestHealthEndpoint:
         data = response.json()
         assert "timestamp" in data
 
+    def test_timestamp_reused_within_one_second(self):
+        """Test the timestamp string is formatted once and then reused."""
+        health_routes._ts_cache[:] = ["", 0.0]
+        first = health_routes._current_timestamp()
+        assert health_routes._current_timestamp() is first
+
+    def test_health_body_matches_model(self, client):
+        """Test the pre-serialized body is valid HealthResponse JSON."""
+        response = client.get("/api/v1/health")
+        assert response.headers["content-type"] == "application/json"
+        health = HealthResponse.model_validate_json(response.content)
+        assert response.content == health.model_dump_json().encode()
+
 
 class TestRootEndpoint:
     """Tests for root endpoint."""
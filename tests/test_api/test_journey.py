@@ -83,6 +83,23 @@ class TestJourneyPlan:
             assert "duration_minutes" in journey
             assert "legs" in journey
 
+    def test_plan_journey_omits_null_fields(self, client):
+        """Test a found journey does not serialize unset optional fields."""
+        response = client.post(
+            "/api/v1/journey/plan",
+            json={
+                "origin": "1001",
+                "destination": "1002",
+                "departure_time": "08:00:00"
+            }
+        )
+        data = response.json()
+        if data.get("journey"):
+            journey = data["journey"]
+            assert None not in journey.values()
+            for leg in journey["legs"]:
+                assert None not in leg.values()
+
     def test_plan_journey_with_fuzzy_names(self, client):
         """Test journey planning with fuzzy stop names."""
         response = client.post(
@@ -174,6 +191,18 @@ class TestJourneyPlan:
         )
         assert response.status_code == 422  # Validation error
 
+    def test_plan_invalid_departure_time(self, client):
+        """Test journey with a malformed departure time."""
+        response = client.post(
+            "/api/v1/journey/plan",
+            json={
+                "origin": "1001",
+                "destination": "1002",
+                "departure_time": "8am"
+            }
+        )
+        assert response.status_code == 422  # Validation error
+
     def test_plan_with_all_parameters(self, client):
         """Test journey with all parameters specified."""
         response = client.post(
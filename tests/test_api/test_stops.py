@@ -115,6 +115,13 @@ class TestGetStopById:
         assert "stop_name" in data
         assert "Test Station A" in data["stop_name"]
 
+    def test_get_stop_coordinates_are_numbers(self, client):
+        """Test stop coordinates are serialized as JSON numbers."""
+        response = client.get("/api/v1/stops/1001")
+        data = response.json()
+        assert isinstance(data["stop_lat"], float)
+        assert isinstance(data["stop_lon"], float)
+
     def test_get_stop_not_found(self, client):
         """Test get stop returns 404 for invalid ID."""
         response = client.get("/api/v1/stops/invalid_stop_id_999")
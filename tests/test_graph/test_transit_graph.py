@@ -130,6 +130,96 @@ class TestConnection:
         assert isinstance(conn.travel_time_seconds, int)
         assert conn.travel_time_seconds == 600
 
+    def test_connection_ids_interned(self):
+        """Test that equal IDs on different connections share one string."""
+        def make():
+            # Build strings at runtime so they are distinct objects
+            return Connection(
+                from_stop_id="".join(["10", "01"]),
+                to_stop_id="".join(["10", "02"]),
+                trip_id="".join(["T", "1"]),
+                departure_time="08:00:00",
+                arrival_time="08:10:00",
+                travel_time_seconds=600,
+                route_id="".join(["R", "1"])
+            )
+
+        first, second = make(), make()
+
+        assert first.from_stop_id is second.from_stop_id
+        assert first.trip_id is second.trip_id
+        assert first.route_id is second.route_id
+        assert first.service_id is None
+
+
+class TestSortedConnections:
+    """Tests for sorted connection caching."""
+
+    def _make_connection(self, departure_time, is_transfer=False):
+        return Connection(
+            from_stop_id="1001",
+            to_stop_id="1002",
+            trip_id="TRANSFER" if is_transfer else "T1",
+            departure_time=departure_time,
+            arrival_time=departure_time,
+            travel_time_seconds=0,
+            route_id="WALK" if is_transfer else "R1",
+            is_transfer=is_transfer
+        )
+
+    def test_sorted_connections_cached(self, graph):
+        """Test repeated calls return the same sorted list."""
+        assert graph.get_sorted_connections() is graph.get_sorted_connections()
+
+    def test_transfers_sorted_last(self):
+        """Test transfers come after regular connections and the boundary is tracked."""
+        graph = TransitGraph()
+        graph.add_connection(self._make_connection("00:00:00", is_transfer=True))
+        graph.add_connection(self._make_connection("09:00:00"))
+        graph.add_connection(self._make_connection("08:00:00"))
+
+        sorted_conns = graph.get_sorted_connections()
+        index = graph.get_first_transfer_index()
+
+        assert index == 2
+        assert [c.departure_time for c in sorted_conns[:index]] == ["08:00:00", "09:00:00"]
+        assert all(c.is_transfer for c in sorted_conns[index:])
+
+    def test_add_connection_invalidates_cache(self):
+        """Test adding a connection invalidates the cached sort."""
+        graph = TransitGraph()
+        graph.add_connection(self._make_connection("09:00:00"))
+        assert len(graph.get_sorted_connections()) == 1
+
+        graph.add_connection(self._make_connection("08:00:00"))
+
+        sorted_conns = graph.get_sorted_connections()
+        assert len(sorted_conns) == 2
+        assert sorted_conns[0].departure_time == "08:00:00"
+        assert graph.get_first_transfer_index() == 2
+
+    def test_add_connection_partitions_by_type(self):
+        """Test connections are split into regular and transfer lists."""
+        graph = TransitGraph()
+        graph.add_connection(self._make_connection("09:00:00"))
+        graph.add_connection(self._make_connection("00:00:00", is_transfer=True))
+
+        assert [c.is_transfer for c in graph.regular_connections] == [False]
+        assert [c.is_transfer for c in graph.transfer_connections] == [True]
+        assert len(graph.connections) == 2
+
+    def test_sorted_times_parallel_to_connections(self):
+        """Test pre-parsed times line up with the sorted connections."""
+        graph = TransitGraph()
+        graph.add_connection(self._make_connection("00:05:00", is_transfer=True))
+        graph.add_connection(self._make_connection("25:10:00"))
+        graph.add_connection(self._make_connection("08:00:30"))
+
+        departures, arrivals = graph.get_sorted_times()
+
+        assert departures.tolist() == [28830, 90600, 300]
+        assert arrivals.tolist() == departures.tolist()
+
 
 class TestGetNeighbors:
     """Tests for get_neighbors method."""
@@ -0,0 +1,156 @@
+"""Tests for UnifiedTransitGraph platform collapsing and inter-mode transfers."""
+
+import pytest
+from pathlib import Path
+
+from src.data.gtfs_parser import GTFSParser
+from src.graph.unified_transit_graph import UnifiedTransitGraph
+from src.routing.journey_planner import JourneyPlanner
+
+
+# Platforms P1A/P1B belong to station S1, P2A to S2 and P3A to S3.
+# Z1 and TR1 are tram stops next to S1; every other stop is a train stop.
+TRAM_STOPS = {"Z1", "TR1"}
+PLATFORMS = {"P1A": "S1", "P1B": "S1", "P2A": "S2", "P3A": "S3"}
+
+
+class SingleFeedMultiModalParser:
+    """
+    Minimal MultiModalGTFSParser stand-in over one loaded GTFSParser.
+
+    All trips come from the one feed; stops are assigned to modes so that
+    transfer hubs can be detected between train and tram stops.
+    """
+
+    def __init__(self, parser: GTFSParser):
+        self._parser = parser
+        self.mode_parsers = {"1": parser}
+
+    def get_mode_for_stop(self, stop_id):
+        return "3" if stop_id in TRAM_STOPS else "1"
+
+    def get_mode_info(self, mode_id):
+        return {"name": f"Mode {mode_id}"}
+
+    def __getattr__(self, name):
+        return getattr(self._parser, name)
+
+
+@pytest.fixture
+def multimodal_parser():
+    """Multi-modal parser over the parent_station test fixtures."""
+    gtfs_dir = Path(__file__).parent.parent / "test_data" / "fixtures_parent_station"
+    return SingleFeedMultiModalParser(GTFSParser(str(gtfs_dir)).load_all())
+
+
+@pytest.fixture
+def platform_graph(multimodal_parser):
+    """Unified graph routing between individual platforms."""
+    return UnifiedTransitGraph(multimodal_parser)
+
+
+@pytest.fixture
+def station_graph(multimodal_parser):
+    """Unified graph with platforms collapsed into their parent stations."""
+    return UnifiedTransitGraph(multimodal_parser, collapse_platforms=True)
+
+
+def _transfer_pairs(graph):
+    return [(c.from_stop_id, c.to_stop_id) for c in graph.transfer_connections]
+
+
+class TestCollapsePlatforms:
+    """Tests for collapse_platforms=True."""
+
+    def test_node_count_after_collapsing(self, platform_graph, station_graph):
+        """Test platforms are replaced by their parent station nodes."""
+        assert platform_graph.graph.number_of_nodes() == 9
+        assert station_graph.graph.number_of_nodes() == 5
+        for platform in PLATFORMS:
+            assert not station_graph.has_stop(platform)
+
+    def test_get_station_id(self, platform_graph, station_graph):
+        """Test platforms map to their station only when collapsing."""
+        for platform, station in PLATFORMS.items():
+            assert station_graph.get_station_id(platform) == station
+            assert platform_graph.get_station_id(platform) == platform
+        assert station_graph.get_station_id("TR1") == "TR1"
+
+    def test_connections_remapped_to_stations(self, station_graph):
+        """Test trip connections start and end at station nodes."""
+        pairs = {(c.from_stop_id, c.to_stop_id, c.trip_id) for c in station_graph.regular_connections}
+        assert pairs == {("S1", "S2", "T1"), ("S2", "S3", "T1"), ("S1", "S2", "T2")}
+
+    def test_same_station_segments_dropped(self, platform_graph, station_graph):
+        """Test a P1B -> P1A segment is dropped once both are station S1."""
+        assert ("P1B", "P1A") in {
+            (c.from_stop_id, c.to_stop_id) for c in platform_graph.regular_connections
+        }
+        assert len(platform_graph.regular_connections) == 4
+        assert len(station_graph.regular_connections) == 3
+        assert all(c.from_stop_id != c.to_stop_id for c in station_graph.regular_connections)
+
+    def test_transfers_between_stations_only(self, station_graph):
+        """Test walking transfers never reference a collapsed platform."""
+        pairs = _transfer_pairs(station_graph)
+        assert set(pairs) == {
+            (a, b) for a in ("Z1", "S1", "TR1") for b in ("Z1", "S1", "TR1") if a != b
+        }
+        assert len(pairs) == len(set(pairs))
+
+    def test_find_journey_from_platform_ids(self, multimodal_parser, station_graph):
+        """Test platform IDs passed to the planner resolve to their stations."""
+        planner = JourneyPlanner(multimodal_parser, station_graph)
+
+        journey = planner.find_journey(
+            origin_stop_id="P1A",
+            destination_stop_id="P3A",
+            departure_time="07:30:00"
+        )
+
+        assert journey is not None
+        assert journey.origin_stop_id == "S1"
+        assert journey.destination_stop_id == "S3"
+        assert journey.arrival_time == "08:20:00"
+
+    def test_find_multiple_journeys_from_platform_ids(self, multimodal_parser, station_graph):
+        """Test the alternatives search also maps platform IDs to stations."""
+        planner = JourneyPlanner(multimodal_parser, station_graph)
+
+        journeys = planner.find_multiple_journeys(
+            origin_stop_id="P1B",
+            destination_stop_id="P2A",
+            departure_time="07:30:00"
+        )
+
+        assert journeys
+        assert all(j.origin_stop_id == "S1" and j.destination_stop_id == "S2" for j in journeys)
+
+
+class TestIntermodeTransfers:
+    """Tests for walking transfers with collapse_platforms=False."""
+
+    def test_one_transfer_per_direction(self, platform_graph):
+        """Test stops sharing a name hub and a coordinate hub get one transfer each way."""
+        hub_stops = ("Z1", "S1", "P1A", "P1B", "TR1")
+        pairs = _transfer_pairs(platform_graph)
+
+        # "alpha" name hub (S1, P1A, P1B, TR1) is a subset of the coordinate
+        # hub around Z1, so every pair is covered exactly once
+        assert len(platform_graph.transfer_hubs) == 2
+        assert set(pairs) == {(a, b) for a in hub_stops for b in hub_stops if a != b}
+        assert len(pairs) == len(set(pairs)) == 20
+
+    def test_platforms_remain_routable(self, multimodal_parser, platform_graph):
+        """Test platform-level routing is unchanged when not collapsing."""
+        planner = JourneyPlanner(multimodal_parser, platform_graph)
+
+        journey = planner.find_journey(
+            origin_stop_id="P1A",
+            destination_stop_id="P3A",
+            departure_time="07:30:00"
+        )
+
+        assert journey is not None
+        assert journey.origin_stop_id == "P1A"
+        assert journey.destination_stop_id == "P3A"
@@ -497,6 +497,17 @@ class TestParseTripUpdates:
         assert len(result["TRIP1"].stop_updates) == 1
         assert result["TRIP1"].stop_updates["STOP1"].departure_delay_seconds == 300
 
+    def test_same_feed_parsed_once(self):
+        """Test a feed object is only parsed again when the fetcher returns a new one."""
+        feed = gtfs_realtime_pb2.FeedMessage()
+        integrator = RealtimeIntegrator(fetcher=Mock())
+
+        first = integrator._get_trip_updates("vline", feed)
+        assert integrator._get_trip_updates("vline", feed) is first
+
+        newer_feed = gtfs_realtime_pb2.FeedMessage()
+        assert integrator._get_trip_updates("vline", newer_feed) is not first
+
 
 class TestEdgeCases:
     """Test edge cases and error handling."""
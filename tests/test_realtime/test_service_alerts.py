@@ -13,7 +13,7 @@ Tests cover:
 
 import pytest
 import time
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, patch
 from google.transit import gtfs_realtime_pb2
 
 from src.realtime.models import (
@@ -478,6 +478,68 @@ class TestServiceAlertParser:
         assert "metro" in parser._cache
         assert len(parser._cache["metro"]) == 3
 
+    def test_cached_lookup_reset_on_fetch(self, mock_feed):
+        """Test cached route lookups are memoised and reset by a new fetch."""
+        mock_fetcher = Mock()
+        mock_fetcher.fetch_service_alerts.return_value = mock_feed
+        parser = ServiceAlertParser(fetcher=mock_fetcher)
+        parser.fetch_alerts(mode="metro")
+
+        assert len(parser.get_alerts_for_route("route-A")) == 1
+        assert ("route", "route-A") in parser._lookup_cache
+
+        mock_fetcher.fetch_service_alerts.return_value = gtfs_realtime_pb2.FeedMessage()
+        parser.fetch_alerts(mode="metro")
+
+        assert parser.get_alerts_for_route("route-A") == []
+
+    def test_same_feed_parsed_once(self, mock_feed):
+        """Test a feed object served again from the fetcher cache is not re-parsed."""
+        mock_fetcher = Mock()
+        mock_fetcher.fetch_service_alerts.return_value = mock_feed
+        parser = ServiceAlertParser(fetcher=mock_fetcher)
+
+        first = parser.fetch_alerts(mode="metro")
+        with patch.object(parser, "parse_feed") as parse_feed:
+            second = parser.fetch_alerts(mode="metro")
+
+        assert second is first
+        parse_feed.assert_not_called()
+
+    def test_lookup_alerts_matches_filters(self, mock_feed):
+        """Test indexed lookups agree with the linear filters and reset on fetch."""
+        mock_fetcher = Mock()
+        mock_fetcher.fetch_service_alerts.return_value = mock_feed
+        parser = ServiceAlertParser(fetcher=mock_fetcher)
+        alerts = parser.fetch_alerts(mode="metro")
+
+        assert parser.lookup_alerts("metro", "route", "route-A") == \
+            parser.get_alerts_for_route("route-A", alerts)
+        assert parser.lookup_alerts("metro", "severity", AlertSeverity.WARNING) == \
+            parser.get_alerts_by_severity(AlertSeverity.WARNING, alerts)
+        assert parser.lookup_alerts("metro", "stop", "no-such-stop") == []
+
+        mock_fetcher.fetch_service_alerts.return_value = gtfs_realtime_pb2.FeedMessage()
+        parser.fetch_alerts(mode="metro")
+
+        assert parser.lookup_alerts("metro", "route", "route-A") == []
+
+    def test_lookup_alerts_ignores_index_for_replaced_list(self, mock_feed):
+        """Test an index built from a since-replaced alert list is never reused."""
+        mock_fetcher = Mock()
+        mock_fetcher.fetch_service_alerts.return_value = mock_feed
+        parser = ServiceAlertParser(fetcher=mock_fetcher)
+        parser.fetch_alerts(mode="metro")
+        parser.lookup_alerts("metro", "route", "route-A")
+        stale_entry = parser._mode_index["metro"]
+
+        # A slow lookup writing back its index after another request refetched
+        mock_fetcher.fetch_service_alerts.return_value = gtfs_realtime_pb2.FeedMessage()
+        parser.fetch_alerts(mode="metro")
+        parser._mode_index["metro"] = stale_entry
+
+        assert parser.lookup_alerts("metro", "route", "route-A") == []
+
     def test_get_alerts_for_route(self, parser, mock_feed):
         """Test filtering alerts by route."""
         alerts = parser.parse_feed(mock_feed)
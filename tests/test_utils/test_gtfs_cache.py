@@ -0,0 +1,115 @@
+"""
+Tests for the on-disk GTFS pickle cache.
+"""
+
+import os
+from unittest.mock import patch
+
+from src.utils import gtfs_cache
+from src.utils.gtfs_cache import gtfs_cache_key, load_cached
+
+
+def _write_gtfs(directory, content="stop_id,stop_name\n1,Test\n"):
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / "stops.txt").write_text(content)
+
+
+class TestGtfsCacheKey:
+    """Tests for gtfs_cache_key."""
+
+    def test_key_stable_for_unchanged_files(self, tmp_path):
+        """Test the key is the same when files are unchanged."""
+        _write_gtfs(tmp_path / "gtfs")
+        assert gtfs_cache_key(tmp_path / "gtfs") == gtfs_cache_key(tmp_path / "gtfs")
+
+    def test_key_changes_when_file_modified(self, tmp_path):
+        """Test the key changes when a GTFS file changes."""
+        gtfs_dir = tmp_path / "gtfs"
+        _write_gtfs(gtfs_dir)
+        before = gtfs_cache_key(gtfs_dir)
+
+        stops = gtfs_dir / "stops.txt"
+        stops.write_text("stop_id,stop_name\n1,Test\n2,Other\n")
+        os.utime(stops, ns=(stops.stat().st_atime_ns, stops.stat().st_mtime_ns + 1_000_000))
+
+        assert gtfs_cache_key(gtfs_dir) != before
+
+    def test_key_changes_when_code_changes(self, tmp_path):
+        """Test caches built by different source code use different keys."""
+        gtfs_dir = tmp_path / "gtfs"
+        _write_gtfs(gtfs_dir)
+        before = gtfs_cache_key(gtfs_dir)
+
+        with patch.object(gtfs_cache, "_code_fingerprint", return_value="other-code"):
+            assert gtfs_cache_key(gtfs_dir) != before
+
+
+class TestLoadCached:
+    """Tests for load_cached."""
+
+    def test_builds_once_then_loads_from_disk(self, tmp_path):
+        """Test the build function only runs on a cache miss."""
+        gtfs_dir = tmp_path / "gtfs"
+        _write_gtfs(gtfs_dir)
+        calls = []
+
+        def build():
+            calls.append(1)
+            return {"stops": ["1"]}
+
+        first = load_cached(gtfs_dir, build, cache_dir=tmp_path / "cache")
+        second = load_cached(gtfs_dir, build, cache_dir=tmp_path / "cache")
+
+        assert first == second == {"stops": ["1"]}
+        assert len(calls) == 1
+
+    def test_corrupt_cache_is_rebuilt(self, tmp_path):
+        """Test an unreadable cache file is ignored and replaced."""
+        gtfs_dir = tmp_path / "gtfs"
+        cache_dir = tmp_path / "cache"
+        _write_gtfs(gtfs_dir)
+        cache_dir.mkdir()
+        (cache_dir / f"gtfs-{gtfs_cache_key(gtfs_dir)}.pkl").write_bytes(b"not a pickle")
+
+        result = load_cached(gtfs_dir, lambda: "rebuilt", cache_dir=cache_dir)
+
+        assert result == "rebuilt"
+        assert load_cached(gtfs_dir, lambda: "other", cache_dir=cache_dir) == "rebuilt"
+
+    def test_cache_raising_any_error_is_rebuilt(self, tmp_path):
+        """Test a torn pickle failing with a non-I/O error still triggers a rebuild."""
+        gtfs_dir = tmp_path / "gtfs"
+        cache_dir = tmp_path / "cache"
+        _write_gtfs(gtfs_dir)
+        load_cached(gtfs_dir, lambda: "old", cache_dir=cache_dir)
+
+        with patch.object(gtfs_cache, "load_cache", side_effect=ValueError("torn")):
+            result = load_cached(gtfs_dir, lambda: "rebuilt", cache_dir=cache_dir)
+
+        assert result == "rebuilt"
+
+    def test_save_leaves_no_temp_files(self, tmp_path):
+        """Test saving writes through a unique temp file that is renamed away."""
+        gtfs_cache.save_cache({"a": 1}, tmp_path / "obj.pkl")
+        gtfs_cache.save_cache({"a": 2}, tmp_path / "obj.pkl")
+
+        assert [p.name for p in tmp_path.iterdir()] == ["obj.pkl"]
+        assert gtfs_cache.load_cache(tmp_path / "obj.pkl") == {"a": 2}
+
+    def test_stale_cache_removed_after_rebuild(self, tmp_path):
+        """Test only the current cache file is kept for a name."""
+        gtfs_dir = tmp_path / "gtfs"
+        cache_dir = tmp_path / "cache"
+        _write_gtfs(gtfs_dir)
+        load_cached(gtfs_dir, lambda: "old", name="modes-1", cache_dir=cache_dir)
+        load_cached(gtfs_dir, lambda: "other", name="modes-1-2", cache_dir=cache_dir)
+
+        stops = gtfs_dir / "stops.txt"
+        stops.write_text("stop_id,stop_name\n2,Changed\n")
+        os.utime(stops, ns=(stops.stat().st_atime_ns, stops.stat().st_mtime_ns + 1_000_000))
+        load_cached(gtfs_dir, lambda: "new", name="modes-1", cache_dir=cache_dir)
+
+        current = f"modes-1-{gtfs_cache_key(gtfs_dir)}.pkl"
+        assert (cache_dir / current).exists()
+        assert len(list(cache_dir.glob("*.pkl"))) == 2  # current + untouched "modes-1-2"
+        assert len(list(cache_dir.glob("modes-1-2-*.pkl"))) == 1
@@ -0,0 +1,31 @@
+"""
+Tests for the shared HTTP session helpers.
+"""
+
+from src.utils.http import (
+    create_http_session,
+    get_http_session,
+    RETRY_STATUS_CODES,
+)
+
+
+class TestCreateHttpSession:
+    """Tests for create_http_session."""
+
+    def test_adapters_mounted_with_retries(self):
+        """Test both schemes use a pooled adapter with retry settings."""
+        session = create_http_session(max_retries=5, backoff_factor=0.5)
+
+        for prefix in ('http://', 'https://'):
+            retry = session.get_adapter(prefix + 'example.com').max_retries
+            assert retry.total == 5
+            assert retry.backoff_factor == 0.5
+            assert set(retry.status_forcelist) == set(RETRY_STATUS_CODES)
+
+
+class TestGetHttpSession:
+    """Tests for get_http_session."""
+
+    def test_returns_shared_session(self):
+        """Test the same session is reused across calls."""
+        assert get_http_session() is get_http_session()
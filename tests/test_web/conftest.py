@@ -73,7 +73,7 @@ def flask_app():
 
     # Now import app - it will use our mocked modules
     import app as flask_app_module
-    flask_app_module.planner = mock_planner
+    flask_app_module._state = flask_app_module._make_state(mock_parser, mock_planner, MagicMock())
 
     flask_app_module.app.config['TESTING'] = True
     flask_app_module.app.config['DEBUG'] = False
@@ -95,6 +95,15 @@ def client(flask_app):
 
 @pytest.fixture
 def mock_requests_get():
-    """Mock requests.get for testing proxy endpoints."""
-    with patch('app.requests.get') as mock_get:
+    """Mock the pooled backend session's get() for testing proxy endpoints."""
+    with patch('app._backend.get') as mock_get:
         yield mock_get
+
+
+@pytest.fixture(autouse=True)
+def clear_proxy_caches(flask_app):
+    """Clear the realtime proxy caches so each test hits the mocked backend."""
+    import app as flask_app_module
+    flask_app_module._vehicle_cache.clear()
+    flask_app_module._alerts_cache.clear()
+    yield
@@ -50,7 +50,7 @@ class TestVehicleProxyEndpoint:
         """Test successful vehicle data fetch from FastAPI backend."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             'success': True,
             'message': 'Found 42 vehicles',
             'mode': 'metro',
@@ -64,7 +64,8 @@ class TestVehicleProxyEndpoint:
                     'current_status': 'IN_TRANSIT_TO'
                 }
             ]
-        }
+        }).encode()
+        mock_response.iter_content.return_value = [mock_response.content]
         mock_requests_get.return_value = mock_response
 
         response = client.get('/api/vehicles?mode=metro')
@@ -79,10 +80,11 @@ class TestVehicleProxyEndpoint:
         """Test vehicles endpoint uses default mode when not specified."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             'success': True,
             'vehicles': []
-        }
+        }).encode()
+        mock_response.iter_content.return_value = [mock_response.content]
         mock_requests_get.return_value = mock_response
 
         client.get('/api/vehicles')
@@ -92,6 +94,19 @@ class TestVehicleProxyEndpoint:
         call_args = mock_requests_get.call_args
         assert 'mode' in call_args.kwargs.get('params', {})
 
+    def test_vehicles_endpoint_streams_upstream(self, client, mock_requests_get):
+        """Test cache misses relay the upstream body in chunks."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.iter_content.return_value = [b'{"success": true, ', b'"vehicles": []}']
+        mock_requests_get.return_value = mock_response
+
+        response = client.get('/api/vehicles?mode=bus')
+
+        assert json.loads(response.get_data()) == {'success': True, 'vehicles': []}
+        assert mock_requests_get.call_args.kwargs.get('stream') is True
+        mock_response.close.assert_called_once()
+
     def test_vehicles_endpoint_connection_error(self, client, mock_requests_get):
         """Test vehicles endpoint handles connection errors gracefully."""
         import requests
@@ -126,6 +141,87 @@ class TestVehicleProxyEndpoint:
 
         assert response.status_code == 503
 
+    def test_vehicles_endpoint_cached_per_mode(self, client, mock_requests_get):
+        """Test repeated polls for the same mode are served from cache."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({
+            'success': True,
+            'vehicles': []
+        }).encode()
+        mock_response.iter_content.return_value = [mock_response.content]
+        mock_requests_get.return_value = mock_response
+
+        first = client.get('/api/vehicles?mode=tram')
+        assert first.status_code == 200
+        first_body = first.get_data()  # Cache is filled once the stream is consumed
+
+        second = client.get('/api/vehicles?mode=tram')
+
+        assert second.get_data() == first_body
+        mock_requests_get.assert_called_once()
+
+    def test_vehicles_endpoint_errors_not_cached(self, client, mock_requests_get):
+        """Test backend errors are not cached."""
+        mock_response = MagicMock()
+        mock_response.status_code = 503
+        mock_requests_get.return_value = mock_response
+
+        client.get('/api/vehicles?mode=tram')
+        client.get('/api/vehicles?mode=tram')
+
+        assert mock_requests_get.call_count == 2
+
+    def test_vehicles_endpoint_invalid_mode(self, client, mock_requests_get):
+        """Test unknown modes are rejected without creating cache or lock entries."""
+        import app as flask_app_module
+
+        response = client.get('/api/vehicles?mode=spaceship')
+
+        assert response.status_code == 400
+        mock_requests_get.assert_not_called()
+        assert not any(mode == 'spaceship' for _, mode in flask_app_module._fetch_locks)
+
+
+class TestVehicleBatchProxyEndpoint:
+    """Test the /api/vehicles/batch proxy endpoint."""
+
+    def test_vehicles_batch_returns_each_mode(self, client, mock_requests_get):
+        """Test batch endpoint fetches and groups results by mode."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({
+            'success': True,
+            'vehicles': []
+        }).encode()
+        mock_requests_get.return_value = mock_response
+
+        response = client.get('/api/vehicles/batch?modes=metro,tram')
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['success'] is True
+        assert set(data['modes']) == {'metro', 'tram'}
+        assert mock_requests_get.call_count == 2
+
+    def test_vehicles_batch_partial_failure(self, client, mock_requests_get):
+        """Test a failing mode does not fail the whole batch."""
+        import requests
+        mock_requests_get.side_effect = requests.exceptions.ConnectionError()
+
+        response = client.get('/api/vehicles/batch?modes=metro')
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['modes']['metro']['success'] is False
+
+    def test_vehicles_batch_invalid_mode(self, client, mock_requests_get):
+        """Test batch endpoint rejects unknown modes."""
+        response = client.get('/api/vehicles/batch?modes=metro,ferry')
+
+        assert response.status_code == 400
+        mock_requests_get.assert_not_called()
+
 
 class TestVehicleSummaryProxyEndpoint:
     """Test the /api/vehicles/summary proxy endpoint."""
@@ -134,7 +230,7 @@ class TestVehicleSummaryProxyEndpoint:
         """Test successful vehicle summary fetch."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             'success': True,
             'mode': 'metro',
             'total_vehicles': 42,
@@ -142,7 +238,7 @@ class TestVehicleSummaryProxyEndpoint:
             'vehicles_in_transit': 35,
             'vehicles_at_stop': 7,
             'average_speed_kmh': 45.2
-        }
+        }).encode()
         mock_requests_get.return_value = mock_response
 
         response = client.get('/api/vehicles/summary?mode=metro')
@@ -171,7 +267,7 @@ class TestAlertsProxyEndpoint:
         """Test successful alerts fetch from FastAPI backend."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             'success': True,
             'message': 'Found 3 alerts',
             'mode': 'metro',
@@ -184,7 +280,7 @@ class TestAlertsProxyEndpoint:
                     'effect': 'REDUCED_SERVICE'
                 }
             ]
-        }
+        }).encode()
         mock_requests_get.return_value = mock_response
 
         response = client.get('/api/alerts?mode=metro')
@@ -210,16 +306,132 @@ class TestAlertsProxyEndpoint:
         """Test alerts endpoint uses default mode."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             'success': True,
             'alerts': []
-        }
+        }).encode()
         mock_requests_get.return_value = mock_response
 
         client.get('/api/alerts')
 
         mock_requests_get.assert_called_once()
 
+    def test_alerts_endpoint_invalid_mode(self, client, mock_requests_get):
+        """Test unknown modes are rejected before reaching the backend."""
+        response = client.get('/api/alerts?mode=spaceship')
+
+        assert response.status_code == 400
+        assert json.loads(response.data)['alerts'] == []
+        mock_requests_get.assert_not_called()
+
+
+class TestEmbeddedBackend:
+    """Test the proxy endpoints with EMBED_FASTAPI enabled."""
+
+    @pytest.fixture
+    def embedded(self, flask_app, monkeypatch):
+        """Call the real FastAPI handlers in-process with a mocked alert feed."""
+        from fastapi import HTTPException, Response
+        from google.transit import gtfs_realtime_pb2
+        import app as flask_app_module
+
+        feed = gtfs_realtime_pb2.FeedMessage()
+        feed.header.gtfs_realtime_version = "2.0"
+        entity = feed.entity.add()
+        entity.id = "alert-001"
+        entity.alert.informed_entity.add().route_id = "route-A"
+
+        service = MagicMock()
+        service.get_realtime_fetcher.return_value.fetch_service_alerts.return_value = feed
+
+        monkeypatch.setattr(flask_app_module, 'EMBED_FASTAPI', True)
+        monkeypatch.setattr(flask_app_module, 'HTTPException', HTTPException, raising=False)
+        monkeypatch.setattr(flask_app_module, 'FastAPIResponse', Response, raising=False)
+        monkeypatch.setattr(flask_app_module, 'get_transit_service', lambda: service, raising=False)
+        monkeypatch.setattr(
+            flask_app_module, '_EMBEDDED_HANDLERS',
+            flask_app_module._build_embedded_handlers(), raising=False
+        )
+
+    def test_alerts_endpoint_embedded(self, client, embedded, mock_requests_get):
+        """Test /api/alerts serves the in-process handler's body."""
+        response = client.get('/api/alerts?mode=metro')
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['success'] is True
+        assert [a['alert_id'] for a in data['alerts']] == ['alert-001']
+        mock_requests_get.assert_not_called()
+
+
+class TestPlanJourneyEndpoint:
+    """Test the /api/plan endpoint's journey serialization."""
+
+    def test_intermediate_names_aligned_with_coordinates(self, client, monkeypatch):
+        """Test skipping a stop without coordinates keeps names paired with IDs."""
+        import app as flask_app_module
+        from src.routing.models import Journey, Leg
+
+        state = flask_app_module._state
+        stops = state['parser'].stops
+        index = MagicMock()
+        index.find_stop_exact.side_effect = lambda name: next(
+            (s for s in stops.values() if s.stop_name == name), None
+        )
+
+        leg = Leg(
+            from_stop_id='47648', from_stop_name='Tarneit Station',
+            to_stop_id='47641', to_stop_name='Waurn Ponds Station',
+            departure_time='08:00:00', arrival_time='08:30:00',
+            trip_id='T1', route_id='R1',
+            intermediate_stops=['No Coords', 'Tarneit Station'],
+            intermediate_stop_ids=['missing', '47648']
+        )
+        planner = MagicMock()
+        planner.find_best_journey.return_value = Journey(
+            origin_stop_id='47648', origin_stop_name='Tarneit Station',
+            destination_stop_id='47641', destination_stop_name='Waurn Ponds Station',
+            departure_time='08:00:00', arrival_time='08:30:00', legs=[leg]
+        )
+        monkeypatch.setattr(
+            flask_app_module, '_state',
+            flask_app_module._make_state(state['parser'], planner, index)
+        )
+
+        response = client.post('/api/plan', json={
+            'origin': 'Tarneit Station',
+            'destination': 'Waurn Ponds Station',
+            'time': '08:00'
+        })
+
+        assert response.status_code == 200
+        intermediate = response.get_json()['journey']['legs'][0]['intermediate']
+        assert intermediate['ids'] == ['47648']
+        assert intermediate['names'] == ['Tarneit Station']
+        assert intermediate['lats'] == [-37.832]
+
+
+class TestStateGenerations:
+    """Test lookup caches are tied to the state generation they came from."""
+
+    def test_fuzzy_lookup_cached_per_generation(self, flask_app):
+        """Test a lookup against an old generation never fills the new one's cache."""
+        import app as flask_app_module
+
+        parser = flask_app_module._state['parser']
+        old_stop, new_stop = MagicMock(stop_id='old'), MagicMock(stop_id='new')
+        old_index, new_index = MagicMock(), MagicMock()
+        old_index.find_stop_fuzzy.return_value = [(old_stop, 90)]
+        new_index.find_stop_fuzzy.return_value = [(new_stop, 90)]
+        old_state = flask_app_module._make_state(parser, MagicMock(), old_index)
+        new_state = flask_app_module._make_state(parser, MagicMock(), new_index)
+
+        # An in-flight request still holding the old generation
+        assert old_state['fuzzy_stop_id']('tarnet') == 'old'
+
+        assert new_state['fuzzy_stop_id'].cache_info().currsize == 0
+        assert new_state['fuzzy_stop_id']('tarnet') == 'new'
+
 
 class TestStationsEndpoint:
     """Test the /api/stations endpoint."""
@@ -265,6 +477,22 @@ class TestStationsEndpoint:
             assert 'lon' in station
 
 
+class TestStopCoords:
+    """Test the precomputed stop coordinate map."""
+
+    def test_blank_coordinates_skipped(self, flask_app):
+        """Test a stop with blank coordinates is skipped instead of failing the load."""
+        import app as flask_app_module
+
+        good = MagicMock(stop_lat='-37.8', stop_lon='144.9')
+        blank = MagicMock(stop_lat='', stop_lon='')
+        parser = MagicMock(stops={'good': good, 'blank': blank})
+
+        coords = flask_app_module._build_stop_coords(parser)
+
+        assert coords == {'good': (-37.8, 144.9)}
+
+
 class TestNavigationLinks:
     """Test that all pages have consistent navigation."""
 